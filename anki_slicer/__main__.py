@@ -1,6 +1,5 @@
 import os
 import logging
-from .player import PlayerUI
 
 
 def main():
@@ -1,11 +1,18 @@
 import requests
 import json
 import os
+from typing import Optional
+
+
+class AnkiConnectError(Exception):
+    """Raised when AnkiConnect is unreachable or rejects a request."""
 
 
 class AnkiConnect:
     def __init__(self, url="http://localhost:8765"):
         self.url = url
+        # Keep-alive session: consecutive calls reuse one local connection
+        self.session = requests.Session()
 
     def is_available(self) -> bool:
         """Return True if AnkiConnect is reachable, else False."""
@@ -21,25 +28,39 @@ class AnkiConnect:
         request_data = {"action": action, "version": 6, "params": params}
 
         try:
-            response = requests.post(self.url, json=request_data)
+            response = self.session.post(self.url, json=request_data)
             response.raise_for_status()
             result = response.json()
 
             if result.get("error"):
-                raise Exception(f"AnkiConnect error: {result['error']}")
+                raise AnkiConnectError(f"AnkiConnect error: {result['error']}")
 
             return result.get("result")
         except requests.exceptions.RequestException as e:
-            raise Exception(f"Failed to connect to AnkiConnect: {e}")
+            raise AnkiConnectError(f"Failed to connect to AnkiConnect: {e}")
+
+    def multi(self, actions: list[tuple[str, dict]]) -> list:
+        """Send several actions in a single request and return their results in order."""
+        payload = [
+            {"action": action, "version": 6, "params": params}
+            for action, params in actions
+        ]
+        results = self._invoke("multi", actions=payload)
+        out = []
+        for (action, _), item in zip(actions, results):
+            if isinstance(item, dict) and item.get("error"):
+                raise AnkiConnectError(f"AnkiConnect error in {action}: {item['error']}")
+            out.append(item.get("result") if isinstance(item, dict) else item)
+        return out
 
     def ensure_deck(self, deck_name: str = "AnkiSlicer"):
         """Ensure a deck exists in Anki (creates if missing)."""
         try:
             self._invoke("createDeck", deck=deck_name)
-        except Exception as e:
+        except AnkiConnectError as e:
             # Ignore if deck already exists
             if "already exists" not in str(e).lower():
-                raise Exception(f"Failed to ensure deck '{deck_name}': {e}")
+                raise AnkiConnectError(f"Failed to ensure deck '{deck_name}': {e}")
 
     def add_note(
         self,
@@ -47,19 +68,44 @@ class AnkiConnect:
         back: str,
         audio_path: str,
         deck_name: str = "AnkiSlicer",
-        tags: list | None = None,
+        tags: Optional[list] = None,
     ):
         """Add a note to Anki with audio attachment."""
-        if tags is None:
-            tags = []
-        note = {
+        note = self._build_note(front, back, audio_path, deck_name, tags)
+        try:
+            result = self._invoke("addNote", note=note)
+            return result
+        except AnkiConnectError as e:
+            raise AnkiConnectError(f"Failed to add note: {e}")
+
+    def add_note_to_deck(
+        self,
+        front: str,
+        back: str,
+        audio_path: str,
+        deck_name: str = "AnkiSlicer",
+        tags: Optional[list] = None,
+    ):
+        """Create the deck (a no-op if it exists) and add the note in one round-trip."""
+        note = self._build_note(front, back, audio_path, deck_name, tags)
+        try:
+            _, note_id = self.multi(
+                [("createDeck", {"deck": deck_name}), ("addNote", {"note": note})]
+            )
+            return note_id
+        except AnkiConnectError as e:
+            raise AnkiConnectError(f"Failed to add note: {e}")
+
+    @staticmethod
+    def _build_note(front, back, audio_path, deck_name, tags) -> dict:
+        return {
             "deckName": deck_name,
             "modelName": "Basic",
             "fields": {
                 "Front": front,
                 "Back": back,
             },
-            "tags": tags,
+            "tags": tags or [],
             "audio": [
                 {
                     "path": audio_path,
@@ -69,17 +115,11 @@ class AnkiConnect:
             ],
         }
 
-        try:
-            result = self._invoke("addNote", note=note)
-            return result
-        except Exception as e:
-            raise Exception(f"Failed to add note: {e}")
-
     def create_deck(self, deck_name: str):
         """Create a new deck if it doesn't exist."""
         try:
             self._invoke("createDeck", deck=deck_name)
-        except Exception as e:
+        except AnkiConnectError as e:
             # Deck might already exist, which is fine
             if "already exists" not in str(e).lower():
-                raise Exception(f"Failed to create deck '{deck_name}': {e}")
+                raise AnkiConnectError(f"Failed to create deck '{deck_name}': {e}")
@@ -13,28 +13,173 @@ from PyQt6.QtWidgets import (
     QFrame,
 )
 from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput
-from PyQt6.QtCore import QUrl, QTimer, Qt, QSettings, QEvent
+from PyQt6.QtCore import (
+    QUrl,
+    QTimer,
+    Qt,
+    QSettings,
+    QEvent,
+    QObject,
+    QRunnable,
+    QThreadPool,
+    pyqtSignal,
+)
 from PyQt6.QtGui import QKeySequence, QAction, QFont
 import logging
 import re
 from anki_slicer.subs import SubtitleEntry
 from anki_slicer.segment_adjuster import SegmentAdjusterWidget
-from anki_slicer.ankiconnect import AnkiConnect
+from anki_slicer.slicer import ffmpeg_encode_pcm, ffmpeg_slice, ffmpeg_to_wav
+from anki_slicer.ui import FileSelectorUI
 import tempfile
+import wave
+import hashlib
+import bisect
+import functools
+import itertools
 import os
-import markdown
 from PyQt6.QtGui import QIcon, QPixmap
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+_APP_ICON_PATH = Path(__file__).resolve().parent.parent / "images" / "app_icon.png"
+
+
+# ASCII table for _sanitize_filename: keep letters, digits, space, "-" and "_"
+_FILENAME_TABLE = str.maketrans(
+    {c: "_" for c in map(chr, range(128)) if not (c.isalnum() or c in " -_")}
+)
+
+# Separators accepted between tags in the Tags field
+_TAG_SPLIT = re.compile(r"[,;\s]+")
+
+
+@functools.lru_cache(maxsize=1)
+def _markdown_converter():
+    """Shared Markdown instance; building one loads every extension again."""
+    import markdown  # deferred: only needed once a card is created
+
+    return markdown.Markdown()
+
 
+def _prewarm_card_stack():
+    """Load what the first card needs (requests, markdown) off the GUI thread."""
+    import anki_slicer.ankiconnect  # noqa: F401
+
+    _markdown_converter()
+
+
+@functools.lru_cache(maxsize=512)
 def format_markdown(text: str) -> str:
-    """Convert Markdown into HTML so Qt/Anki can render bullets/lists/etc."""
-    return markdown.markdown(text)
+    """Convert Markdown into HTML so Qt/Anki can render bullets/lists/etc.
+
+    Cached: a segment's text is rendered again on every card attempt for it.
+    """
+    return _markdown_converter().reset().convert(text)
+
+
+def prepared_wav_path(mp3_path: str) -> str:
+    """Return a 44.1 kHz stereo WAV copy of mp3_path for playback.
+
+    Conversions are cached in the temp dir keyed by path, mtime and size, so
+    reopening the same file skips the decode and an edited file is redone.
+    """
+    st = os.stat(mp3_path)
+    key = hashlib.blake2b(
+        f"{os.path.abspath(mp3_path)}|{st.st_mtime_ns}|{st.st_size}".encode(),
+        digest_size=8,
+    ).hexdigest()
+    wav_path = os.path.join(tempfile.gettempdir(), f"ankislicer-{key}.wav")
+    if not os.path.exists(wav_path):
+        # Write under a unique private name, then rename, so a crash, a second
+        # instance or a second preparation in this process never sees (or
+        # writes into) a half-written cache file
+        fd, part_path = tempfile.mkstemp(
+            dir=os.path.dirname(wav_path), prefix="ankislicer-", suffix=".part"
+        )
+        os.close(fd)
+        try:
+            # ffmpeg streams straight to disk; pydub holds the whole decode in RAM
+            if not ffmpeg_to_wav(mp3_path, part_path):
+                from pydub import AudioSegment
+
+                audio = AudioSegment.from_file(mp3_path)
+                audio = audio.set_frame_rate(44100).set_channels(2)
+                audio.export(part_path, format="wav").close()
+            os.replace(part_path, wav_path)
+        finally:
+            # Only left behind if a step above failed
+            if os.path.exists(part_path):
+                os.unlink(part_path)
+    return wav_path
+
+
+class _AudioPrepSignals(QObject):
+    ready = pyqtSignal(str, object)  # wav path, (samples, sample_rate)
+    failed = pyqtSignal(str)
+
+
+class _AudioPrepTask(QRunnable):
+    """Convert the source to the playback WAV and read its waveform off the UI thread."""
+
+    def __init__(self, mp3_path: str):
+        super().__init__()
+        self.mp3_path = mp3_path
+        self.signals = _AudioPrepSignals()
+
+    def run(self):
+        try:
+            wav_path = prepared_wav_path(self.mp3_path)
+        except Exception as e:
+            logger.exception("Failed to prepare audio for %s", self.mp3_path)
+            self.signals.failed.emit(str(e))
+            return
+        # The WAV decodes much faster than the source and has the same timeline
+        self.signals.ready.emit(wav_path, SegmentAdjusterWidget.read_waveform(wav_path))
+
+
+class _CardSignals(QObject):
+    done = pyqtSignal()
+    failed = pyqtSignal(object)  # the exception raised by the work
+
+
+class _CardTask(QRunnable):
+    """Run a card's slow steps (audio slice, AnkiConnect request) off the UI thread."""
+
+    def __init__(self, work):
+        super().__init__()
+        self.work = work
+        self.signals = _CardSignals()
+
+    def run(self):
+        try:
+            self.work()
+        except Exception as e:
+            self.signals.failed.emit(e)
+            return
+        self.signals.done.emit()
 
 
 class PlayerUI(QWidget):
+    # Extend button styles; applied only when the active state flips
+    _EXTEND_STYLE_ACTIVE = (
+        "background-color:#3565B1; color:#ffffff; border:1px solid #dddddd; border-radius:4px; padding:6px 16px;"
+    )
+    _EXTEND_STYLE_INACTIVE = (
+        "border:1px solid #dddddd; border-radius:4px; padding:6px 16px; background:#ffffff; color:#000;"
+    )
+    _EXTEND_LABEL = "Extend Selection →→"
+    _APP_ICON = None  # QIcon shared by all windows; see _app_qicon
+    _APP_ICON_PIXMAP = None  # 64x64 dialog graphic; see _app_icon_pixmap
+    # Shared styles for repeated widgets
+    _PANEL_STYLE = "background-color:#ffffff; border:none; border-radius:6px;"
+    _FIELD_STYLE = "border:1px solid #dddddd; border-radius:4px; background-color:#ffffff; padding:6px;"
+    _NUDGE_BUTTON_STYLE = "font-size: 16px; font-weight: bold; border:1px solid #dddddd; border-radius:4px;"
+    # Create button styles; applied only when the enabled state flips
+    _CREATE_STYLE_ENABLED = "background-color: #3565B1; color: white; font-weight: bold;"
+    _CREATE_STYLE_DISABLED = "background-color: #cccccc; color: #666666;"
+
     def __init__(
         self,
         mp3_path: str,
@@ -47,17 +192,26 @@ class PlayerUI(QWidget):
         self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
 
         # Set window icon if present
-        try:
-            icon_path = Path(__file__).resolve().parent.parent / "images" / "app_icon.png"
-            if icon_path.exists():
-                self.setWindowIcon(QIcon(str(icon_path)))
-        except Exception:
-            pass
+        icon = self._app_qicon()
+        if not icon.isNull():
+            self.setWindowIcon(icon)
 
         self.mp3_path = mp3_path
+        # Card clips go here; resolved once so a later cwd change can't move it
+        self._clip_dir = os.path.abspath("anki_clips")
         self.orig_entries = orig_entries
         self.trans_entries = trans_entries
         self.current_index = 0
+        # Segment start positions in player milliseconds, used for every seek
+        self._orig_start_ms = [int(e.start_time * 1000) for e in orig_entries]
+        # Segment starts and running-max ends (seconds) for bisecting the
+        # playback position; the linear scan is kept for (rare) files whose
+        # cues are out of order
+        self._start_times = [e.start_time for e in orig_entries]
+        self._max_end_times = list(itertools.accumulate((e.end_time for e in orig_entries), max))
+        self._starts_sorted = all(
+            a <= b for a, b in zip(self._start_times, self._start_times[1:])
+        )
 
         # Do not mutate parsed subtitles from UI edits; keep user edits separately
         # so parsing issues are easier to diagnose. Keys are 0-based indices.
@@ -70,13 +224,80 @@ class PlayerUI(QWidget):
         self.waiting_for_resume = False
         self.card_created_for_current_segment = False
         self.is_adjusted_preview = False  # track preview vs normal pause
+        # True while code (not the user) fills the editors; edit handlers ignore it
+        self._updating_ui = False
+        # Set once the playback WAV is loaded (see _on_audio_ready)
+        self._audio_ready = False
+        # Whole second last shown in the time label (-1 forces a refresh)
+        self._last_time_label_secs = -1
+        self._total_time_str = self.format_time(0)  # formatted once per duration
+        # Last position pushed to the slider and the slider's pixels per ms,
+        # so sub-pixel position updates can be skipped
+        self._last_slider_ms = -1
+        self._slider_px_per_ms = 0.0
+
+        # Extended selection state (chainable)
+        self.extend_active = False
+        self.extend_count = 0  # number of extra segments appended (0..2)
+        self.extend_direction = 1  # +1 until 3, then -1 back to 0
+        self.extend_end_index = None
+        self.extend_base_index = None
+        self.extend_sel_start = None
+        self.extend_sel_end = None
+        self.temp_combined_orig = None
+        self.temp_combined_trans = None
+        # Segment numbers of the extended range ("3–5"), for messages
+        self._extend_label: str | None = None
+        # Last style/text pushed to the Extend button (None = not applied yet)
+        self._last_extend_style_active: bool | None = None
+        self._last_extend_text: str | None = None
+        # Last enabled state applied to the Create button (None = not applied yet)
+        self._create_btn_enabled: bool | None = None
+
+        # Translation edits are converted to Markdown once typing pauses; the
+        # (extend mode, index) they belong to is captured at the first keystroke
+        self._pending_trans_target: tuple[bool, int] | None = None
+        self._trans_commit_timer = QTimer(self)
+        self._trans_commit_timer.setSingleShot(True)
+        self._trans_commit_timer.setInterval(150)
+        self._trans_commit_timer.timeout.connect(self._commit_translation_edit)
+        # Markdown last loaded into the translation editor; cleared on user
+        # edits so the editor is only re-rendered when its content would change
+        self._shown_trans: str | None = None
+
+        # AnkiConnect client (created on first card) and decks known to exist,
+        # so createDeck is only sent the first time a deck is used
+        self._anki = None
+        self._known_decks: set[str] = set()
+        # Notes already sent this session as (deck, front, back, start, end),
+        # so revisiting a segment cannot add the same card twice
+        self._submitted_notes: set[tuple] = set()
+        # The card being written on the thread pool (None when idle); only
+        # one is in flight so AnkiConnect requests never overlap
+        self._card_job: dict | None = None
+        # Message box shared by _message (created on first use)
+        self._msgbox: QMessageBox | None = None
+
+        # Optional on-screen debug label (enabled via ANKI_SLICER_DEBUG)
+        self.debug_enabled = bool(os.getenv("ANKI_SLICER_DEBUG"))
+        # Handlers call update_debug several times per action; refresh the
+        # label at most every 100 ms instead
+        self._debug_timer = QTimer(self)
+        self._debug_timer.setSingleShot(True)
+        self._debug_timer.setInterval(100)
+        self._debug_timer.timeout.connect(self._refresh_debug)
 
         # More wiggle room around each subtitle
         self.MARGIN_SEC = 1.0
 
         # For search
         self.search_matches: list[int] = []
+        # Lowercased, NUL-joined texts plus entry start offsets, built on the
+        # first search; the original side is rebuilt after text edits
+        self._orig_search_index: tuple[str, list[int]] | None = None
+        self._trans_search_index: tuple[str, list[int]] | None = None
         self.search_index = 0
+        self.search_total = 0
 
         # Player setup
         self.player = QMediaPlayer()
@@ -86,19 +307,18 @@ class PlayerUI(QWidget):
         # Update play/pause UI when state changes
         self.player.playbackStateChanged.connect(self._on_playback_state_changed)
 
-        # Convert to wav for stable playback
-        from pydub import AudioSegment
-
-        self._tmp_wav = tempfile.NamedTemporaryFile(delete=False, suffix=".wav")
-        audio = AudioSegment.from_file(mp3_path)
-        audio = audio.set_frame_rate(44100).set_channels(2)
-        audio.export(self._tmp_wav.name, format="wav")
-        self.player.setSource(QUrl.fromLocalFile(self._tmp_wav.name))
-
-        # Timers
+        # Timers (the subtitle-follow timer only runs while playing)
         self.timer = QTimer()
         self.timer.setInterval(100)
         self.timer.timeout.connect(self.update_subtitles)
+        self._last_follow_pos_ms = -1
+        # One catch-up check after playback stops. Deferred to the event loop:
+        # pause() emits the state change synchronously, before the caller has
+        # finished updating its own state (pending index, extend range)
+        self._follow_check = QTimer(self)
+        self._follow_check.setSingleShot(True)
+        self._follow_check.setInterval(0)
+        self._follow_check.timeout.connect(self.update_subtitles)
 
         # Single-shot timer for stopping at end of range
         self.auto_pause_timer = QTimer(self)
@@ -112,10 +332,26 @@ class PlayerUI(QWidget):
 
         # Settings
         self.settings = QSettings("AnkiSlicer", "PlayerUI")
+        # Deck/source/tags are written together once typing pauses
+        self._settings_flush = QTimer(self)
+        self._settings_flush.setSingleShot(True)
+        self._settings_flush.setInterval(500)
+        self._settings_flush.timeout.connect(self.save_anki_fields)
 
         # Build UI
         self.setup_ui()
-        self.timer.start()
+
+        # Convert to wav for stable playback (cached across launches). This runs
+        # on the thread pool so the window is usable while a long file decodes.
+        self._wav_path = None
+        self.time_label.setText("Preparing audio…")
+        task = _AudioPrepTask(mp3_path)
+        self._audio_prep_signals = task.signals
+        task.signals.ready.connect(self._on_audio_ready)
+        task.signals.failed.connect(self._on_audio_failed)
+        QThreadPool.globalInstance().start(task)
+        # Keep the cold imports out of the first "Create Anki Card" click
+        QThreadPool.globalInstance().start(_prewarm_card_stack)
 
         # Keyboard shortcut for Play/Pause (space bar)
         self.play_action = QAction("Play/Pause", self)
@@ -136,13 +372,42 @@ class PlayerUI(QWidget):
         # Waveform click-to-preview
         self.adjuster.installEventFilter(self)
 
-    def save_anki_deck_name(self, *_):
+    def _on_audio_ready(self, wav_path: str, waveform):
+        self._wav_path = wav_path
+        # Reset before setSource: it can emit durationChanged/positionChanged
+        # synchronously, and those must land on top of the reset
+        self._last_time_label_secs = -1
+        self.time_label.setText("00:00 / 00:00")
+        self.player.setSource(QUrl.fromLocalFile(wav_path))
+        self.adjuster.set_waveform(*waveform)
+        self._audio_ready = True
+
+    def _on_audio_failed(self, error: str):
+        self.time_label.setText("Audio unavailable")
+        self._message(
+            QMessageBox.Icon.Critical,
+            "Audio Error",
+            f"Failed to prepare the audio file for playback: {error}",
+        )
+
+    def _schedule_settings_save(self, *_):
         # Accepts the signal's str arg (or none) without complaining
+        self._settings_flush.start()
+
+    def save_anki_fields(self):
+        self._settings_flush.stop()
         self.settings.setValue("anki_deck_name", self.anki_deck_input.text().strip())
+        self.settings.setValue("anki_source", self.source_input.text())
+        self.settings.setValue("anki_tags", self.tags_input.text())
+        self.settings.sync()
+
+    def closeEvent(self, event):  # type: ignore[override]
+        if self._settings_flush.isActive():
+            self.save_anki_fields()
+        super().closeEvent(event)
 
     def setup_ui(self):
         layout = QVBoxLayout()
-        self._updating_ui = False
 
         # Top bar (grey area): Load files button
         top_bar = QHBoxLayout()
@@ -158,7 +423,7 @@ class PlayerUI(QWidget):
 
         # === Text panel (Search + Original/Translation) ===
         text_panel = QFrame()
-        text_panel.setStyleSheet("background-color:#ffffff; border:none; border-radius:6px;")
+        text_panel.setStyleSheet(self._PANEL_STYLE)
         text_layout = QVBoxLayout(text_panel)
         text_layout.setContentsMargins(16, 16, 16, 16)
         text_layout.setSpacing(10)
@@ -293,7 +558,7 @@ class PlayerUI(QWidget):
 
         # === Audio panel (Slider, controls, waveform, segment controls) ===
         audio_panel = QFrame()
-        audio_panel.setStyleSheet("background-color:#ffffff; border:none; border-radius:6px;")
+        audio_panel.setStyleSheet(self._PANEL_STYLE)
         audio_layout = QVBoxLayout(audio_panel)
         audio_layout.setContentsMargins(16, 16, 16, 16)
         audio_layout.setSpacing(10)
@@ -340,7 +605,8 @@ class PlayerUI(QWidget):
         audio_layout.addLayout(controls)
 
         # === Waveform widget ===
-        self.adjuster = SegmentAdjusterWidget(self.mp3_path, self.player)
+        # Waveform samples arrive with the prepared audio (_on_audio_ready)
+        self.adjuster = SegmentAdjusterWidget(None, self.player)
         self.adjuster.setFixedHeight(160)
         audio_layout.addWidget(self.adjuster)
 
@@ -354,7 +620,7 @@ class PlayerUI(QWidget):
         self.start_plus = QPushButton("+")
         for btn in (self.start_minus, self.start_plus):
             btn.setFixedSize(32, 32)
-            btn.setStyleSheet("font-size: 16px; font-weight: bold; border:1px solid #dddddd; border-radius:4px;")
+            btn.setStyleSheet(self._NUDGE_BUTTON_STYLE)
         segment_controls_row.addWidget(start_label)
         segment_controls_row.addWidget(self.start_minus)
         segment_controls_row.addWidget(self.start_plus)
@@ -362,12 +628,9 @@ class PlayerUI(QWidget):
         segment_controls_row.addStretch(1)
 
         # Extend Selection between start and end controls
-        self.add_next_btn = QPushButton("Extend Selection →→")
+        self.add_next_btn = QPushButton()
         self.add_next_btn.clicked.connect(self.toggle_extend_selection)
         self.add_next_btn.setMinimumWidth(200)
-        self.add_next_btn.setStyleSheet(
-            "border: 1px solid #dddddd; border-radius: 4px; padding: 6px 16px; background:#ffffff; color:#000;"
-        )
         segment_controls_row.addWidget(self.add_next_btn)
 
         segment_controls_row.addStretch(1)
@@ -378,23 +641,19 @@ class PlayerUI(QWidget):
         self.end_plus = QPushButton("+")
         for btn in (self.end_minus, self.end_plus):
             btn.setFixedSize(32, 32)
-            btn.setStyleSheet("font-size: 16px; font-weight: bold; border:1px solid #dddddd; border-radius:4px;")
+            btn.setStyleSheet(self._NUDGE_BUTTON_STYLE)
         segment_controls_row.addWidget(end_label)
         segment_controls_row.addWidget(self.end_minus)
         segment_controls_row.addWidget(self.end_plus)
 
         audio_layout.addLayout(segment_controls_row)
-        # Ensure initial inactive styling/text for Extend button
-        try:
-            self.set_extend_button_active_style(False)
-            self.add_next_btn.setText("Extend Selection →→")
-        except Exception:
-            pass
+        # Initial inactive styling/text for Extend button
+        self.set_extend_button_active_style(False)
+        self._set_extend_button_text(self._EXTEND_LABEL)
         # Add audio panel to main layout
         layout.addWidget(audio_panel)
 
         # Optional on-screen debug label (enabled via ANKI_SLICER_DEBUG)
-        self.debug_enabled = bool(os.getenv("ANKI_SLICER_DEBUG"))
         if self.debug_enabled:
             self.debug_label = QLabel("")
             self.debug_label.setStyleSheet(
@@ -414,7 +673,7 @@ class PlayerUI(QWidget):
 
         # === Anki panel ===
         anki_panel = QFrame()
-        anki_panel.setStyleSheet("background-color:#ffffff; border:none; border-radius:6px;")
+        anki_panel.setStyleSheet(self._PANEL_STYLE)
         bottom_row = QHBoxLayout(anki_panel)
         bottom_row.setContentsMargins(16, 16, 16, 16)
         bottom_row.setSpacing(10)
@@ -428,31 +687,27 @@ class PlayerUI(QWidget):
 
         # Deck field
         self.anki_deck_input = QLineEdit()
-        self.anki_deck_input.setStyleSheet("border:1px solid #dddddd; border-radius:4px; background-color:#ffffff; padding:6px;")
+        self.anki_deck_input.setStyleSheet(self._FIELD_STYLE)
         self.anki_deck_input.setText(
             self.settings.value("anki_deck_name", "AnkiSlicer")
         )
-        self.anki_deck_input.textChanged.connect(self.save_anki_deck_name)
+        self.anki_deck_input.textChanged.connect(self._schedule_settings_save)
         form.addRow("Anki Deck:", self.anki_deck_input)
 
         # Source field
         self.source_input = QLineEdit()
-        self.source_input.setStyleSheet("border:1px solid #dddddd; border-radius:4px; background-color:#ffffff; padding:6px;")
+        self.source_input.setStyleSheet(self._FIELD_STYLE)
         self.source_input.setPlaceholderText("e.g., YouTube URL or show name")
         self.source_input.setText(self.settings.value("anki_source", ""))
-        self.source_input.textChanged.connect(
-            lambda *_: self.settings.setValue("anki_source", self.source_input.text())
-        )
+        self.source_input.textChanged.connect(self._schedule_settings_save)
         form.addRow("Source:", self.source_input)
 
         # Tags field
         self.tags_input = QLineEdit()
-        self.tags_input.setStyleSheet("border:1px solid #dddddd; border-radius:4px; background-color:#ffffff; padding:6px;")
+        self.tags_input.setStyleSheet(self._FIELD_STYLE)
         self.tags_input.setPlaceholderText("comma-separated, e.g., Chinese,news,HSK")
         self.tags_input.setText(self.settings.value("anki_tags", ""))
-        self.tags_input.textChanged.connect(
-            lambda *_: self.settings.setValue("anki_tags", self.tags_input.text())
-        )
+        self.tags_input.textChanged.connect(self._schedule_settings_save)
         form.addRow("Tags:", self.tags_input)
 
         bottom_row.addLayout(form, stretch=3)
@@ -466,6 +721,7 @@ class PlayerUI(QWidget):
         self.create_card_btn.setStyleSheet(
             "padding: 12px 24px; font-size: 18px; font-weight: bold; border:1px solid #dddddd; border-radius:6px;"
         )
+        self._create_btn_enabled = None  # custom style above; next call restyles
         bottom_row.addWidget(
             self.create_card_btn,
             stretch=0,
@@ -477,69 +733,74 @@ class PlayerUI(QWidget):
 
         self.setLayout(layout)
         self.update_subtitle_display()
-        # Extended selection state (chainable)
-        self.extend_active = False
-        self.extend_count = 0  # number of extra segments appended (0..2)
-        self.extend_direction = 1  # +1 until 3, then -1 back to 0
-        self.extend_end_index = None
-        self.extend_base_index = None
-        self.extend_sel_start = None
-        self.extend_sel_end = None
-        self.temp_combined_orig = None
-        self.temp_combined_trans = None
 
     def on_original_changed(self):
-        if getattr(self, "_updating_ui", False):
+        if self._updating_ui:
             return
-        try:
-            if getattr(self, "extend_active", False):
-                # Do not persist edits into entries during extended mode
-                self.temp_combined_orig = self.orig_input.text()
-            else:
-                self.orig_entries[self.current_index].text = self.orig_input.text()
-        except Exception:
-            pass
+        if self.extend_active:
+            # Do not persist edits into entries during extended mode
+            self.temp_combined_orig = self.orig_input.text()
+        else:
+            self.orig_entries[self.current_index].text = self.orig_input.text()
+            self._orig_search_index = None
         self.card_created_for_current_segment = False
         self.set_create_button_enabled(True)
 
     def on_translation_changed(self):
-        if getattr(self, "_updating_ui", False):
+        if self._updating_ui:
             return
-        try:
-            text = self._get_current_translation_markdown()
-            if getattr(self, "extend_active", False):
-                self.temp_combined_trans = text
-            else:
-                # Avoid creating an override that erases a non-empty parsed value
-                parsed = (
-                    self.trans_entries[self.current_index].text
-                    if self.current_index < len(self.trans_entries)
-                    else ""
-                )
-                if not text.strip() and (parsed or "").strip():
-                    # ignore empty override when parsed has content
-                    pass
-                elif text == (parsed or ""):
-                    # identical to parsed -> clear override if present
-                    if self.current_index in self.trans_overrides:
-                        self.trans_overrides.pop(self.current_index, None)
-                else:
-                    # meaningful user edit
-                    self.trans_overrides[self.current_index] = text
-        except Exception:
-            pass
+        self._shown_trans = None
+        if self._pending_trans_target is None:
+            self._pending_trans_target = (self.extend_active, self.current_index)
+        self._trans_commit_timer.start()
         self.card_created_for_current_segment = False
         self.set_create_button_enabled(True)
 
+    def _commit_translation_edit(self):
+        """Store a pending translation edit on the segment it was typed into.
+
+        Called by the debounce timer, and before anything that replaces the
+        editor contents or reads the overrides.
+        """
+        self._trans_commit_timer.stop()
+        if self._pending_trans_target is None:
+            return
+        extend_mode, index = self._pending_trans_target
+        self._pending_trans_target = None
+        text = self._get_current_translation_markdown()
+        if extend_mode:
+            self.temp_combined_trans = text
+        else:
+            # Avoid creating an override that erases a non-empty parsed value
+            parsed = (
+                self.trans_entries[index].text
+                if index < len(self.trans_entries)
+                else ""
+            )
+            if not text.strip() and (parsed or "").strip():
+                # ignore empty override when parsed has content
+                pass
+            elif text == (parsed or ""):
+                # identical to parsed -> clear override if present
+                if index in self.trans_overrides:
+                    self.trans_overrides.pop(index, None)
+            else:
+                # meaningful user edit
+                self.trans_overrides[index] = text
+
     # Persist edits into the current entries
     def save_current_edits(self):
-        try:
-            if not getattr(self, "extend_active", False):
-                orig_text = self.orig_input.text()
-                self.orig_entries[self.current_index].text = orig_text
-        except Exception:
-            pass
-        # No-op for translation: we keep overrides only
+        # Translation edits are kept as overrides, never written to entries
+        self._commit_translation_edit()
+        if self.extend_active:
+            return
+        # on_original_changed already stores typed text, so this is usually
+        # a no-op; only a real change should invalidate the search corpus
+        orig_text = self.orig_input.text()
+        entry = self.orig_entries[self.current_index]
+        if entry.text != orig_text:
+            entry.text = orig_text
+            self._orig_search_index = None
 
     # Styled enable/disable for the Create button
     def set_create_button_enabled(self, enabled: bool):
@@ -547,39 +808,65 @@ class PlayerUI(QWidget):
         # the create button is constructed.
         if not hasattr(self, "create_card_btn"):
             return
+        # Stays disabled while a card is being written; _on_card_done and
+        # _on_card_failed re-evaluate it once the job is cleared
+        enabled = enabled and self._card_job is None
+        # Called on every navigation and keystroke; restyling re-parses the CSS
+        if enabled == self._create_btn_enabled:
+            return
+        self._create_btn_enabled = enabled
         self.create_card_btn.setEnabled(enabled)
-        if enabled:
-            self.create_card_btn.setStyleSheet(
-                "background-color: #3565B1; color: white; font-weight: bold;"
-            )
-        else:
-            self.create_card_btn.setStyleSheet(
-                "background-color: #cccccc; color: #666666;"
-            )
+        self.create_card_btn.setStyleSheet(
+            self._CREATE_STYLE_ENABLED if enabled else self._CREATE_STYLE_DISABLED
+        )
 
     # === Helper methods for audio export ===
     def _sanitize_filename(self, name: str) -> str:
-        safe = "".join(
-            ch if ch.isalnum() or ch in (" ", "-", "_") else "_" for ch in name
-        )
+        if name.isascii():
+            safe = name.translate(_FILENAME_TABLE)
+        else:
+            safe = "".join(
+                ch if ch.isalnum() or ch in (" ", "-", "_") else "_" for ch in name
+            )
         safe = "_".join(safe.split())
         return safe[:80] if safe else "clip"
 
     def _export_clip_fallback(
         self, out_dir: str, start_sec: float, end_sec: float, index_for_name: int
     ) -> str:
-        from pydub import AudioSegment
-
         os.makedirs(out_dir, exist_ok=True)
-        audio = AudioSegment.from_file(self.mp3_path)
         s = max(0, int(start_sec * 1000))
         e = max(s + 10, int(end_sec * 1000))
         base = f"{index_for_name:04d}_{int(start_sec*1000)}-{int(end_sec*1000)}"
         base = self._sanitize_filename(base)
         out_path = os.path.abspath(os.path.join(out_dir, base + ".mp3"))
-        audio[s:e].export(out_path, format="mp3")
+        # Cheapest first: read the clip's frames from the prepared WAV, then
+        # let ffmpeg seek the source; pydub (whole-file decode) is the last resort
+        if self._encode_clip_from_wav(s, e, out_path):
+            return out_path
+        if not ffmpeg_slice(self.mp3_path, s / 1000, e / 1000, out_path):
+            from pydub import AudioSegment
+
+            audio = AudioSegment.from_file(self.mp3_path)
+            audio[s:e].export(out_path, format="mp3")
         return out_path
 
+    def _encode_clip_from_wav(self, start_ms: int, end_ms: int, out_path: str) -> bool:
+        if not self._wav_path:
+            return False
+        try:
+            with wave.open(self._wav_path, "rb") as wav:
+                if wav.getsampwidth() != 2:
+                    return False
+                rate = wav.getframerate()
+                first = min(start_ms * rate // 1000, wav.getnframes())
+                wav.setpos(first)
+                pcm = wav.readframes(end_ms * rate // 1000 - first)
+                channels = wav.getnchannels()
+        except (OSError, wave.Error):
+            return False
+        return bool(pcm) and ffmpeg_encode_pcm(pcm, rate, channels, out_path)
+
     # === Segment Adjustment Helper ===
     def nudge_segment(self, which: str, delta: float):
         start, end = self.adjuster.get_adjusted_segment()
@@ -613,6 +900,8 @@ class PlayerUI(QWidget):
         self.play_adjusted_segment()
 
     def play_adjusted_segment(self):
+        if not self._audio_ready:
+            return
         start, end = self.adjuster.get_adjusted_segment()
         self.auto_pause_timer.stop()
         self.is_adjusted_preview = True
@@ -650,6 +939,13 @@ class PlayerUI(QWidget):
         if position_sec >= self.orig_entries[-1].end_time:
             return len(self.orig_entries) - 1
 
+        if self._starts_sorted:
+            # Same answer as the scan below: the first segment containing the
+            # position, else the last one starting before it (i.e. in a gap)
+            last_started = bisect.bisect_right(self._start_times, position_sec) - 1
+            first_containing = bisect.bisect_left(self._max_end_times, position_sec)
+            return min(first_containing, last_started)
+
         for i, entry in enumerate(self.orig_entries):
             if entry.start_time <= position_sec <= entry.end_time:
                 return i
@@ -662,10 +958,13 @@ class PlayerUI(QWidget):
     def update_subtitles(self):
         # Don't change subtitle index during adjusted previews
         # Also freeze the index entirely while extended selection is active
-        if self.slider_active or self.is_adjusted_preview or getattr(self, "extend_active", False):
+        if self.slider_active or self.is_adjusted_preview or self.extend_active:
+            return
+        pos_ms = self.player.position()
+        if pos_ms == self._last_follow_pos_ms:
             return
-        position_sec = self.player.position() / 1000.0
-        new_index = self.find_subtitle_index(position_sec)
+        self._last_follow_pos_ms = pos_ms
+        new_index = self.find_subtitle_index(pos_ms / 1000.0)
         if new_index != self.current_index:
             self.save_current_edits()
             self.current_index = new_index
@@ -677,7 +976,7 @@ class PlayerUI(QWidget):
         margin = float(self.MARGIN_SEC)
 
         # If extended, union base..end
-        if getattr(self, "extend_active", False) and self.extend_end_index is not None and self.extend_end_index < len(self.orig_entries):
+        if self.extend_active and self.extend_end_index is not None and self.extend_end_index < len(self.orig_entries):
             base_idx = self.extend_base_index if self.extend_base_index is not None else self.current_index
             base_entry = self.orig_entries[base_idx]
             # Use locked selection if available (prevents drifting)
@@ -700,51 +999,41 @@ class PlayerUI(QWidget):
         self.update_debug()
 
     def update_subtitle_display(self):
+        # Keep a just-typed translation before the editor is repopulated
+        self._commit_translation_edit()
         orig_entry = self.orig_entries[self.current_index]
-        trans_entry = (
-            self.trans_entries[self.current_index]
-            if self.current_index < len(self.trans_entries)
-            else None
-        )
 
         # Decide what to show based on extended mode.
-        if getattr(self, "extend_active", False) and self.extend_end_index is not None and self.extend_end_index < len(self.orig_entries):
+        if self.extend_active and self.extend_end_index is not None and self.extend_end_index < len(self.orig_entries):
             # Always rebuild combined display from the anchored base to end to avoid omissions
             base_idx = self.extend_base_index if self.extend_base_index is not None else self.current_index
             end_idx = self.extend_end_index
-            orig_parts = [self.orig_entries[i].text for i in range(base_idx, end_idx + 1)]
-            show_orig = " ".join(p.strip() for p in orig_parts if p).strip()
+            show_orig = self._combined_orig_text(base_idx, end_idx)
             # Build translation strictly from parsed translation entries only (no fallback).
-            trans_parts: list[str] = []
-            for i in range(base_idx, end_idx + 1):
-                # Use override if present; otherwise parsed text
-                if i in self.trans_overrides:
-                    t = self.trans_overrides[i]
-                else:
-                    t = self.trans_entries[i].text if i < len(self.trans_entries) else ""
-                # Preserve empty lines to reflect missing translations explicitly
-                trans_parts.append(t or "")
-            show_trans = "\n".join(trans_parts)
+            # Preserve empty lines to reflect missing translations explicitly
+            show_trans = "\n".join(
+                self._effective_translation(i) or "" for i in range(base_idx, end_idx + 1)
+            )
         else:
             show_orig = orig_entry.text
             # Always show exactly what was parsed/overridden for translation (no fallback)
-            if self.current_index in self.trans_overrides:
-                show_trans = self.trans_overrides[self.current_index]
-            else:
-                show_trans = trans_entry.text if trans_entry else ""
+            show_trans = self._effective_translation(self.current_index)
 
         # Populate editors without triggering change handlers
         try:
             self._updating_ui = True
-            self.orig_input.setText(show_orig)
-            if show_trans:
-                # Render Markdown in the editor while still disallowing rich-text pastes
-                if hasattr(self.trans_editor, 'setMarkdown'):
-                    self.trans_editor.setMarkdown(show_trans)
+            if show_orig != self.orig_input.text():
+                self.orig_input.setText(show_orig)
+            if show_trans != self._shown_trans:
+                if show_trans:
+                    # Render Markdown in the editor while still disallowing rich-text pastes
+                    if hasattr(self.trans_editor, 'setMarkdown'):
+                        self.trans_editor.setMarkdown(show_trans)
+                    else:
+                        self.trans_editor.setPlainText(show_trans)
                 else:
-                    self.trans_editor.setPlainText(show_trans)
-            else:
-                self.trans_editor.clear()
+                    self.trans_editor.clear()
+                self._shown_trans = show_trans
         finally:
             self._updating_ui = False
 
@@ -757,34 +1046,45 @@ class PlayerUI(QWidget):
 
     # ----- Message helpers (use app icon on dialogs) -----
     def _app_qicon(self) -> QIcon:
-        try:
-            icon_path = Path(__file__).resolve().parent.parent / "images" / "app_icon.png"
-            if icon_path.exists():
-                return QIcon(str(icon_path))
-        except Exception:
-            pass
-        return QIcon()
-
-    def _message(self, icon: QMessageBox.Icon, title: str, text: str):
-        box = QMessageBox(self)
-        # Set titlebar/dock icon
-        box.setWindowIcon(self._app_qicon())
+        # Loaded once per process and shared by every window and dialog
+        if PlayerUI._APP_ICON is None:
+            PlayerUI._APP_ICON = (
+                QIcon(str(_APP_ICON_PATH)) if _APP_ICON_PATH.exists() else QIcon()
+            )
+        return PlayerUI._APP_ICON
+
+    def _app_icon_pixmap(self) -> QPixmap:
+        # Decoded and scaled once; a null pixmap means the icon file is missing
+        if PlayerUI._APP_ICON_PIXMAP is None:
+            pm = QPixmap(str(_APP_ICON_PATH)) if _APP_ICON_PATH.exists() else QPixmap()
+            PlayerUI._APP_ICON_PIXMAP = pm.scaled(64, 64) if not pm.isNull() else pm
+        return PlayerUI._APP_ICON_PIXMAP
+
+    def _message(self, icon: QMessageBox.Icon, title: str, text: str, blocking: bool = True):
+        box = self._msgbox
+        if box is None:
+            # Built once and reused for every message from this window
+            box = self._msgbox = QMessageBox(self)
+            # Set titlebar/dock icon
+            box.setWindowIcon(self._app_qicon())
         box.setIcon(icon)
+        # Also set the dialog icon pixmap so the in-dialog graphic is our app
+        # icon (setIcon above replaces it each time)
+        pm = self._app_icon_pixmap()
+        if not pm.isNull():
+            box.setIconPixmap(pm)
         box.setWindowTitle(title)
         box.setText(text)
-        # Also set the dialog icon pixmap so the in-dialog graphic is our app icon
-        try:
-            icon_path = Path(__file__).resolve().parent.parent / "images" / "app_icon.png"
-            if icon_path.exists():
-                pm = QPixmap(str(icon_path))
-                if not pm.isNull():
-                    box.setIconPixmap(pm.scaled(64, 64))
-        except Exception:
-            pass
-        box.exec()
+        if blocking:
+            box.exec()
+        else:
+            # Window-modal but returns immediately, so playback keeps going
+            box.open()
 
     # Spacebar play/pause
     def toggle_play(self):
+        if not self._audio_ready:
+            return
         if self.player.playbackState() == QMediaPlayer.PlaybackState.PlayingState:
             self.auto_pause_timer.stop()
             self.player.pause()
@@ -798,30 +1098,33 @@ class PlayerUI(QWidget):
             self.pending_index = None
             self.update_subtitle_display()
             self.waiting_for_resume = False
-            entry = self.orig_entries[self.current_index]
-            self.player.setPosition(int(entry.start_time * 1000))
+            self.player.setPosition(self._orig_start_ms[self.current_index])
         elif not self.is_adjusted_preview:
-            entry = self.orig_entries[self.current_index]
-            self.player.setPosition(int(entry.start_time * 1000))
+            self.player.setPosition(self._orig_start_ms[self.current_index])
 
         self.player.play()
         self._update_forward_button_label()
 
         # Schedule auto-pause if enabled
         if self.auto_pause_mode:
-            end_time = self._current_playback_end_time()
-            remaining_ms = max(0, int(end_time * 1000 - self.player.position()))
-            self.auto_pause_timer.stop()
-            self.auto_pause_timer.start(remaining_ms)
+            self._schedule_auto_pause(self._current_playback_end_time())
 
-    def _auto_pause_hit(self):
-        self.player.pause()
+    def _schedule_auto_pause(self, end_time: float):
+        """Arm the auto-pause timer to fire at end_time (seconds into the media)."""
+        remaining_ms = max(0, int(end_time * 1000 - self.player.position()))
+        # start() restarts a running timer, so no stop() is needed first
+        self.auto_pause_timer.start(remaining_ms)
 
+    def _auto_pause_hit(self):
         if self.is_adjusted_preview:
+            self.player.pause()
             self.is_adjusted_preview = False
             return
 
+        # Taken before pausing, while current_index is still the cue that
+        # just ended
         self.pending_index = min(self.current_index + 1, len(self.orig_entries) - 1)
+        self.player.pause()
         self.waiting_for_resume = True
         # Update the Forward button label when paused
         self._update_forward_button_label()
@@ -840,9 +1143,7 @@ class PlayerUI(QWidget):
         ):
             pos_sec = self.player.position() / 1000.0
             self.current_index = self.find_subtitle_index(pos_sec)
-            end_time = self._current_playback_end_time()
-            remaining_ms = max(0, int(end_time * 1000 - self.player.position()))
-            self.auto_pause_timer.start(remaining_ms)
+            self._schedule_auto_pause(self._current_playback_end_time())
 
     # === Forward/Back ===
     def forward_to_next(self):
@@ -850,7 +1151,7 @@ class PlayerUI(QWidget):
         if (
             self.current_index == 0
             and self.player.playbackState() != QMediaPlayer.PlaybackState.PlayingState
-            and self.pos_slider.value() == 0
+            and self.player.position() == 0
         ):
             self.jump_to_current_subtitle_and_play()
             return
@@ -870,7 +1171,7 @@ class PlayerUI(QWidget):
 
     def jump_to_current_subtitle_and_play(self):
         entry = self.orig_entries[self.current_index]
-        self.player.setPosition(int(entry.start_time * 1000))
+        self.player.setPosition(self._orig_start_ms[self.current_index])
         self.update_subtitle_display()
         self.waiting_for_resume = False
         self.player.play()
@@ -878,9 +1179,7 @@ class PlayerUI(QWidget):
         self.set_create_button_enabled(True)
 
         if self.auto_pause_mode:
-            self.auto_pause_timer.stop()
-            remaining_ms = max(0, int(entry.end_time * 1000 - self.player.position()))
-            self.auto_pause_timer.start(remaining_ms)
+            self._schedule_auto_pause(entry.end_time)
 
     # === Slider ===
     def on_slider_pressed(self):
@@ -907,24 +1206,52 @@ class PlayerUI(QWidget):
             self.auto_pause_mode
             and self.player.playbackState() == QMediaPlayer.PlaybackState.PlayingState
         ):
-            entry = self.orig_entries[self.current_index]
-            remaining_ms = max(0, int(entry.end_time * 1000 - self.player.position()))
-            self.auto_pause_timer.start(remaining_ms)
+            self._schedule_auto_pause(self.orig_entries[self.current_index].end_time)
 
     def update_slider(self, pos):
-        if not self.pos_slider.isSliderDown():
+        if (
+            not self.slider_active
+            and abs(pos - self._last_slider_ms) * self._slider_px_per_ms >= 1.0
+        ):
+            # Programmatic move; nothing listening needs valueChanged
+            self.pos_slider.blockSignals(True)
             self.pos_slider.setValue(pos)
+            self.pos_slider.blockSignals(False)
+            self._last_slider_ms = pos
+        # The label only has second granularity; skip formatting mid-second ticks
+        secs = pos // 1000
+        if secs == self._last_time_label_secs:
+            return
+        self._last_time_label_secs = secs
         self.time_label.setText(
-            f"{self.format_time(pos)} / {self.format_time(self.total_duration)}"
+            f"{self.format_time(pos)} / {self._total_time_str}"
         )
 
     def update_duration(self, dur):
         self.total_duration = dur
+        self._total_time_str = self.format_time(dur)
+        self._last_time_label_secs = -1
         self.pos_slider.setRange(0, dur)
+        self._update_slider_scale()
         self.show_current_segment_in_adjuster()
         self.update_debug()
 
+    def _update_slider_scale(self):
+        self._slider_px_per_ms = self.pos_slider.width() / max(1, self.total_duration)
+        self._last_slider_ms = -1  # force the next position through
+
+    def resizeEvent(self, event):  # type: ignore[override]
+        super().resizeEvent(event)
+        self._update_slider_scale()
+
     def _on_playback_state_changed(self, state):
+        if state == QMediaPlayer.PlaybackState.PlayingState:
+            self.timer.start()
+        else:
+            # Position is settled now; one last check replaces idle polling
+            self.timer.stop()
+            self._last_follow_pos_ms = -1
+            self._follow_check.start()
         self._update_forward_button_label()
 
     def _update_forward_button_label(self):
@@ -945,19 +1272,16 @@ class PlayerUI(QWidget):
         self.update_debug()
 
     def _current_playback_end_time(self) -> float:
-        if getattr(self, "extend_active", False) and self.extend_end_index is not None and self.extend_end_index < len(self.orig_entries):
+        if self.extend_active and self.extend_end_index is not None and self.extend_end_index < len(self.orig_entries):
             if self.extend_sel_end is not None:
                 return self.extend_sel_end
             return self.orig_entries[self.extend_end_index].end_time
         return self.orig_entries[self.current_index].end_time
 
     def _infer_index_from_adjuster_start(self) -> int:
-        try:
-            sel_start, _ = self.adjuster.get_adjusted_segment()
-            # Nudge inside the segment to avoid boundary ambiguity
-            return self.find_subtitle_index(max(0.0, sel_start + 1e-6))
-        except Exception:
-            return self.current_index
+        sel_start, _ = self.adjuster.get_adjusted_segment()
+        # Nudge inside the segment to avoid boundary ambiguity
+        return self.find_subtitle_index(max(0.0, sel_start + 1e-6))
 
     def seek(self, pos):
         self.player.setPosition(pos)
@@ -982,99 +1306,83 @@ class PlayerUI(QWidget):
         self.update_debug()
 
     def update_debug(self):
-        if not getattr(self, 'debug_enabled', False):
-            return
-        try:
-            base_idx = self.extend_base_index if getattr(self, 'extend_base_index', None) is not None else self.current_index
-            end_idx = self.extend_end_index if getattr(self, 'extend_end_index', None) is not None else self.current_index
-            sel_start, sel_end = self.adjuster.get_adjusted_segment()
-            playing = self.player.playbackState() == QMediaPlayer.PlaybackState.PlayingState
-            pos_ms = self.player.position()
-            # Peek at translation parts for troubleshooting
-            # Effective translation values (consider overrides)
-            t0 = (
-                self.trans_overrides.get(base_idx)
-                if base_idx in self.trans_overrides
-                else (self.trans_entries[base_idx].text if base_idx < len(self.trans_entries) else "")
-            )
-            t1 = (
-                self.trans_overrides.get(base_idx + 1)
-                if (base_idx + 1) in self.trans_overrides
-                else (self.trans_entries[base_idx + 1].text if base_idx + 1 < len(self.trans_entries) else "")
-            )
-            t0s = (t0 or "").replace("\n", " ⏎ ")[:40]
-            t1s = (t1 or "").replace("\n", " ⏎ ")[:40]
-            peek = (
-                f"t0len={len((t0 or '').strip())} t1len={len((t1 or '').strip())} "
-                f"t0='{t0s}' t1='{t1s}'"
-            )
-            text = (
-                f"idx={self.current_index+1} base={base_idx+1} end={end_idx+1} "
-                f"count={getattr(self,'extend_count',0)} dir={getattr(self,'extend_direction',1)} active={getattr(self,'extend_active',False)} "
-                f"sel={sel_start:.3f}-{sel_end:.3f} pos={pos_ms/1000.0:.3f}s playing={playing} autopause={self.auto_pause_mode} {peek}"
-            )
+        if self.debug_enabled and not self._debug_timer.isActive():
+            self._debug_timer.start()
+
+    def _refresh_debug(self):
+        base_idx = self.extend_base_index if self.extend_base_index is not None else self.current_index
+        end_idx = self.extend_end_index if self.extend_end_index is not None else self.current_index
+        sel_start, sel_end = self.adjuster.get_adjusted_segment()
+        playing = self.player.playbackState() == QMediaPlayer.PlaybackState.PlayingState
+        pos_ms = self.player.position()
+        # Peek at translation parts for troubleshooting
+        # Effective translation values (consider overrides)
+        t0 = self._effective_translation(base_idx)
+        t1 = self._effective_translation(base_idx + 1)
+        # Slice before replacing so long combined texts aren't copied in full
+        t0s = (t0 or "")[:40].replace("\n", " ⏎ ")
+        t1s = (t1 or "")[:40].replace("\n", " ⏎ ")
+        peek = (
+            f"t0len={len((t0 or '').strip())} t1len={len((t1 or '').strip())} "
+            f"t0='{t0s}' t1='{t1s}'"
+        )
+        text = (
+            f"idx={self.current_index+1} base={base_idx+1} end={end_idx+1} "
+            f"count={self.extend_count} dir={self.extend_direction} active={self.extend_active} "
+            f"sel={sel_start:.3f}-{sel_end:.3f} pos={pos_ms/1000.0:.3f}s playing={playing} autopause={self.auto_pause_mode} {peek}"
+        )
+        if text != self.debug_label.text():
             self.debug_label.setText(text)
-        except Exception:
-            pass
 
     def open_file_selector(self):
-        try:
-            self.auto_pause_timer.stop()
-            if self.player.playbackState() == QMediaPlayer.PlaybackState.PlayingState:
-                self.player.pause()
-        except Exception:
-            pass
+        self.auto_pause_timer.stop()
+        if self.player.playbackState() == QMediaPlayer.PlaybackState.PlayingState:
+            self.player.pause()
         # Launch the file selector to load a new set of files
         try:
-            from .ui import FileSelectorUI
             # Keep a reference so it doesn't get garbage-collected immediately
             self._selector_window = FileSelectorUI()
-            try:
-                # When selector launches a new player, close this one
-                self._selector_window.playerLaunched.connect(self._on_new_player_launched)
-            except Exception:
-                pass
+            # When selector launches a new player, close this one
+            self._selector_window.playerLaunched.connect(self._on_new_player_launched)
             self._selector_window.show()
         except Exception:
-            pass
+            logger.exception("Failed to open the file selector")
         # Do not close this window immediately; it will close when the selector launches the new player
 
     def _on_new_player_launched(self):
-        try:
-            self.close()
-        except Exception:
-            pass
+        # Rendered Markdown from this file's translations won't be reused
+        format_markdown.cache_clear()
+        self.close()
 
     def set_extend_button_active_style(self, active: bool):
-        if active:
-            self.add_next_btn.setStyleSheet(
-                "background-color:#3565B1; color:#ffffff; border:1px solid #dddddd; border-radius:4px; padding:6px 16px;"
-            )
-        else:
-            self.add_next_btn.setStyleSheet(
-                "border:1px solid #dddddd; border-radius:4px; padding:6px 16px; background:#ffffff; color:#000;"
-            )
+        # setStyleSheet re-parses the CSS and repolishes; skip if unchanged
+        if active == self._last_extend_style_active:
+            return
+        self._last_extend_style_active = active
+        self.add_next_btn.setStyleSheet(
+            self._EXTEND_STYLE_ACTIVE if active else self._EXTEND_STYLE_INACTIVE
+        )
+
+    def _set_extend_button_text(self, text: str):
+        if text == self._last_extend_text:
+            return
+        self._last_extend_text = text
+        self.add_next_btn.setText(text)
 
     def refresh_extend_button_ui(self):
-        try:
-            if getattr(self, 'extend_active', False) and getattr(self, 'extend_count', 0) > 0:
-                self.set_extend_button_active_style(True)
-                self.add_next_btn.setText(f"Extend Selection →→ ({self.extend_count})")
-            else:
-                self.set_extend_button_active_style(False)
-                self.add_next_btn.setText("Extend Selection →→")
-        except Exception:
-            pass
+        if self.extend_active and self.extend_count > 0:
+            self.set_extend_button_active_style(True)
+            self._set_extend_button_text(f"{self._EXTEND_LABEL} ({self.extend_count})")
+        else:
+            self.set_extend_button_active_style(False)
+            self._set_extend_button_text(self._EXTEND_LABEL)
 
     def toggle_extend_selection(self):
         # Stop current preview and pause so rapid clicks always respond
-        try:
-            self.auto_pause_timer.stop()
-            self.is_adjusted_preview = False
-            if self.player.playbackState() == QMediaPlayer.PlaybackState.PlayingState:
-                self.player.pause()
-        except Exception:
-            pass
+        self.auto_pause_timer.stop()
+        self.is_adjusted_preview = False
+        if self.player.playbackState() == QMediaPlayer.PlaybackState.PlayingState:
+            self.player.pause()
         # Cycle extend count: 0→1→2→1→0 ... (max two extra segments)
         base_idx_for_limits = (
             self.extend_base_index if self.extend_active and self.extend_base_index is not None else self.current_index
@@ -1095,10 +1403,12 @@ class PlayerUI(QWidget):
         elif next_count < 0:
             next_count = 0
         self.set_extend_count(next_count)
+        # Button and debug label are refreshed once, after all state changes
         self.refresh_extend_button_ui()
         self.update_debug()
 
     def set_extend_count(self, count: int):
+        self._commit_translation_edit()
         count = max(0, min(2, count))
         base_idx = self.extend_base_index if self.extend_base_index is not None else self.current_index
         max_extras = min(2, len(self.orig_entries) - 1 - base_idx)
@@ -1109,42 +1419,48 @@ class PlayerUI(QWidget):
             # Capture base idx before reset, so we can snap back
             base_idx_local = base_idx
             self.cancel_extend_selection()
-            try:
-                # Snap selection back to base and pause
-                self.current_index = base_idx_local
-                entry = self.orig_entries[base_idx_local]
-                self.player.pause()
-                self.player.setPosition(int(entry.start_time * 1000))
-            except Exception:
-                pass
+            # Snap selection back to base and pause
+            self.current_index = base_idx_local
+            self.player.pause()
+            self.player.setPosition(self._orig_start_ms[base_idx_local])
             self.update_subtitle_display()
-            self.refresh_extend_button_ui()
             return
         # Compute end index and lock selection
         self.extend_end_index = base_idx + self.extend_count
         self.extend_sel_start = self.orig_entries[base_idx].start_time
         self.extend_sel_end = self.orig_entries[self.extend_end_index].end_time
+        # The range is contiguous by construction, so first–last is enough
+        self._extend_label = f"{base_idx + 1}–{self.extend_end_index + 1}"
         # Force the visible/current index to the anchored base to prevent UI drift
         self.current_index = base_idx
         # Build combined texts across range
-        orig_parts = [self.orig_entries[i].text for i in range(base_idx, self.extend_end_index + 1)]
-        self.temp_combined_orig = " ".join(p.strip() for p in orig_parts if p).strip()
-        trans_parts = []
-        for i in range(base_idx, self.extend_end_index + 1):
-            if i < len(self.trans_entries):
-                t = self.trans_entries[i].text
-                if t:
-                    trans_parts.append(t.strip())
+        end_idx = self.extend_end_index
+        self.temp_combined_orig = self._combined_orig_text(base_idx, end_idx)
+        # Slicing clips to the translation list, so no bounds checks are needed
+        trans_parts = [
+            e.text.strip() for e in self.trans_entries[base_idx : end_idx + 1] if e.text
+        ]
         self.temp_combined_trans = "\n".join(trans_parts).strip()
-        # Visuals + playback
-        self.refresh_extend_button_ui()
+        # Visuals + playback (the caller refreshes the button/debug label)
         self.update_subtitle_display()
         self.show_current_segment_in_adjuster()
         self.play_adjusted_segment()
-        self.update_debug()
+
+    def _combined_orig_text(self, base_idx: int, end_idx: int) -> str:
+        """Original lines base_idx..end_idx joined into one sentence."""
+        return " ".join(
+            e.text.strip() for e in self.orig_entries[base_idx : end_idx + 1] if e.text
+        ).strip()
+
+    def _effective_translation(self, index: int) -> str:
+        """Translation for a segment: the user's override, else the parsed text."""
+        if index in self.trans_overrides:
+            return self.trans_overrides[index]
+        return self.trans_entries[index].text if index < len(self.trans_entries) else ""
 
     def cancel_extend_selection(self):
-        if not getattr(self, "extend_active", False):
+        self._commit_translation_edit()
+        if not self.extend_active:
             return
         self.extend_active = False
         self.extend_count = 0
@@ -1155,12 +1471,12 @@ class PlayerUI(QWidget):
         self.extend_sel_end = None
         self.temp_combined_orig = None
         self.temp_combined_trans = None
+        self._extend_label = None
         self.set_extend_button_active_style(False)
-        self.add_next_btn.setText("Extend Selection →→")
-        # Restore editors to current segment only
+        self._set_extend_button_text(self._EXTEND_LABEL)
+        # Restore editors to current segment only (this also resets the
+        # waveform selection and the debug label)
         self.update_subtitle_display()
-        self.show_current_segment_in_adjuster()
-        self.update_debug()
 
     # === Search Features ===
     def run_search(self):
@@ -1168,16 +1484,17 @@ class PlayerUI(QWidget):
         if not term:
             self._message(QMessageBox.Icon.Warning, "Empty Search", "Please enter a search term.")
             return
-        self.search_matches = []
-        for i, entry in enumerate(self.orig_entries):
-            orig_text = entry.text.lower()
-            trans_text = (
-                self.trans_entries[i].text.lower()
-                if i < len(self.trans_entries)
-                else ""
+        if self._orig_search_index is None:
+            self._orig_search_index = self._build_search_index(
+                e.text for e in self.orig_entries
+            )
+        if self._trans_search_index is None:
+            self._trans_search_index = self._build_search_index(
+                e.text for e in self.trans_entries[: len(self.orig_entries)]
             )
-            if term in orig_text or term in trans_text:
-                self.search_matches.append(i)
+        hits = self._search_hits(self._orig_search_index, term)
+        hits |= self._search_hits(self._trans_search_index, term)
+        self.search_matches = sorted(hits)
         if not self.search_matches:
             self._message(QMessageBox.Icon.Information, "No Results", f"No matches for '{term}'.")
             self.search_btn.setText("Search")
@@ -1188,10 +1505,32 @@ class PlayerUI(QWidget):
         self.search_btn.setText("Next Match")
         self.jump_to_match()
 
+    @staticmethod
+    def _build_search_index(texts) -> tuple[str, list[int]]:
+        # Lowercase per entry so offsets stay right even where lower() changes length
+        lowered = [t.lower() for t in texts]
+        starts = list(itertools.accumulate((len(t) + 1 for t in lowered), initial=0))
+        return "\0".join(lowered), starts[:-1]
+
+    @staticmethod
+    def _search_hits(index: tuple[str, list[int]], term: str) -> set[int]:
+        """Entry indices whose text contains term, via str.find over the joined corpus."""
+        corpus, starts = index
+        hits = set()
+        pos = corpus.find(term)
+        while pos != -1:
+            i = bisect.bisect_right(starts, pos) - 1
+            hits.add(i)
+            if i + 1 >= len(starts):
+                break
+            # One hit per entry is enough; resume at the next entry
+            pos = corpus.find(term, starts[i + 1])
+        return hits
+
     def on_search_button(self):
         # If we already have matches, the button advances to the next match
         self.cancel_extend_selection()
-        if getattr(self, 'search_matches', None):
+        if self.search_matches:
             self.next_match()
         else:
             self.run_search()
@@ -1204,16 +1543,10 @@ class PlayerUI(QWidget):
             self.cancel_extend_selection()
             self.save_current_edits()
             self.current_index = idx
-        entry = self.orig_entries[idx]
-        self.player.setPosition(int(entry.start_time * 1000))
+        self.player.setPosition(self._orig_start_ms[idx])
         self.update_subtitle_display()
         # Update counter before incrementing the index
-        try:
-            current_pos = self.search_index + 1
-            total = getattr(self, 'search_total', len(self.search_matches))
-            self.search_counter.setText(f"{current_pos} of {total}")
-        except Exception:
-            pass
+        self.search_counter.setText(f"{self.search_index + 1} of {self.search_total}")
         self.search_index = (self.search_index + 1) % len(self.search_matches)
         self.show_current_segment_in_adjuster()
 
@@ -1225,10 +1558,9 @@ class PlayerUI(QWidget):
         self.search_matches = []
         self.search_index = 0
         self.search_total = 0
-        if hasattr(self, 'search_btn'):
-            self.search_btn.setText("Search")
-        if hasattr(self, 'search_counter'):
-            self.search_counter.setText("")
+        # Connected after both widgets are built, so they always exist here
+        self.search_btn.setText("Search")
+        self.search_counter.setText("")
         self.cancel_extend_selection()
         self.update_debug()
 
@@ -1237,26 +1569,18 @@ class PlayerUI(QWidget):
 
     # === Anki Card Creation ===
     def create_anki_card(self):
-        # Local imports to avoid circulars
+        # Local imports keep requests off the startup path (and avoid circulars)
         from anki_slicer.ankiconnect import AnkiConnect
-        from anki_slicer.slicer import slice_audio
-        import os
+
+        # One card at a time; the click is ignored while one is being written
+        if self._card_job is not None:
+            return
 
         # 1) Check Anki availability FIRST (show a friendly message if not running)
-        anki = AnkiConnect()
-        try:
-            if hasattr(anki, "is_available"):
-                if not anki.is_available():
-                    self._message(
-                        QMessageBox.Icon.Warning,
-                        "Anki Not Running",
-                        "Anki with the Anki-Connect add-on must be running.",
-                    )
-                    return
-            else:
-                # Fallback ping
-                anki._invoke("version")
-        except Exception:
+        if self._anki is None:
+            self._anki = AnkiConnect()
+        # is_available() pings AnkiConnect and reports any failure as False
+        if not self._anki.is_available():
             self._message(
                 QMessageBox.Icon.Warning,
                 "Anki Not Running",
@@ -1288,77 +1612,130 @@ class PlayerUI(QWidget):
         tags_text = (self.tags_input.text() or "").strip()
         # Normalize tags from comma/space/semicolon separated to list
         raw_tags = (
-            [t.strip() for t in re.split(r"[,;\s]+", tags_text) if t.strip()]
+            [t for t in _TAG_SPLIT.split(tags_text) if t]
             if tags_text
             else []
         )
+        # Back side: Markdown → HTML. Use current editor's Markdown (safer than cached entry text)
+        if hasattr(self.trans_editor, 'toMarkdown'):
+            md_current = self.trans_editor.toMarkdown().strip()
+        else:
+            md_current = self.trans_editor.toPlainText().strip()
+        back_html = format_markdown(md_current) if md_current else "(no translation)"
+        if source_text:
+            back_html = back_html + f"<div style=\"margin-top:8px;color:#666;\"><em>Source: {source_text}</em></div>"
+        front = self.orig_input.text().strip() or current_entry.text
+
+        # Skip notes already sent this session (e.g. after navigating back)
+        note_key = (deck_name, front, back_html, round(start_sec, 3), round(end_sec, 3))
+        if note_key in self._submitted_notes:
+            self._message(
+                QMessageBox.Icon.Information,
+                "Already Created",
+                f"An identical card was already added to deck '{deck_name}' in this session.",
+            )
+            self.card_created_for_current_segment = True
+            self.set_create_button_enabled(False)
+            return
+
+        # 4) Slice and send on the thread pool so playback and navigation
+        # keep running while ffmpeg and Anki work
+        self._card_job = {
+            "deck": deck_name,
+            "note_key": note_key,
+            "index": self.current_index,
+            "label": self._extend_label if self.extend_active else None,
+        }
+        task = _CardTask(
+            functools.partial(
+                self._write_card,
+                current_entry,
+                self.current_index + 1,
+                start_sec,
+                end_sec,
+                front,
+                back_html,
+                deck_name,
+                raw_tags,
+                deck_name not in self._known_decks,
+            )
+        )
+        self._card_signals = task.signals
+        task.signals.done.connect(self._on_card_done)
+        task.signals.failed.connect(self._on_card_failed)
+        self.set_create_button_enabled(False)
+        self.create_card_btn.setText("Creating…")
+        QThreadPool.globalInstance().start(task)
 
-        # 4) Main operation (single try/except)
-        try:
-            # Ensure deck exists
-            if hasattr(anki, "ensure_deck"):
-                anki.ensure_deck(deck_name)
-            else:
-                anki.create_deck(deck_name)
+    def _write_card(
+        self, entry, clip_number, start_sec, end_sec, front, back_html, deck_name, tags, new_deck
+    ):
+        """Slice the clip and add the note. Runs on the thread pool."""
+        from anki_slicer.slicer import slice_audio
 
-            # Ensure output dir
-            out_dir = "anki_clips"
-            os.makedirs(out_dir, exist_ok=True)
+        # Slice audio (slice_audio creates the directory and returns a
+        # path under it, already absolute)
+        clip_path = slice_audio(
+            self.mp3_path,
+            entry,
+            self._clip_dir,
+            override_start=start_sec,
+            override_end=end_sec,
+        )
 
-            # Slice audio
-            clip_path = slice_audio(
-                self.mp3_path,
-                current_entry,
-                out_dir,
-                override_start=start_sec,
-                override_end=end_sec,
+        # Fallback if the slicer didn't produce a file (rare). It raises
+        # when it cannot write the clip, so no second check is needed.
+        if not os.path.exists(clip_path):
+            clip_path = self._export_clip_fallback(
+                self._clip_dir, start_sec, end_sec, clip_number
             )
-            clip_path = os.path.abspath(clip_path)
-
-            # Fallback if the slicer didn't produce a file (rare)
-            if not os.path.exists(clip_path):
-                clip_path = self._export_clip_fallback(
-                    out_dir, start_sec, end_sec, self.current_index + 1
-                )
-            if not os.path.exists(clip_path):
-                raise FileNotFoundError(f"Clip not found after slicing: {clip_path}")
-
-            # ✅ Add note to Anki with Markdown → HTML conversion + optional source/tags
-            # Use current editor's Markdown (safer than cached entry text)
-            if hasattr(self.trans_editor, 'toMarkdown'):
-                md_current = self.trans_editor.toMarkdown().strip()
-            else:
-                md_current = self.trans_editor.toPlainText().strip()
-            back_html = format_markdown(md_current) if md_current else "(no translation)"
-            if source_text:
-                back_html = back_html + f"<div style=\"margin-top:8px;color:#666;\"><em>Source: {source_text}</em></div>"
 
-            anki.add_note(
-                self.orig_input.text().strip() or current_entry.text,
-                back_html,
-                clip_path,
-                deck_name=deck_name,
-                tags=raw_tags,
+        # ✅ Add note to Anki with optional source/tags
+        if new_deck:
+            # createDeck is idempotent, so it rides along with addNote in one request
+            self._anki.add_note_to_deck(
+                front, back_html, clip_path, deck_name=deck_name, tags=tags
             )
+        else:
+            self._anki.add_note(front, back_html, clip_path, deck_name=deck_name, tags=tags)
 
-            # Success UI + state
-            # Friendly message shows combined segment indices when extended
-            if getattr(self, "extend_active", False) and self.extend_end_index is not None:
-                base_idx = self.extend_base_index if self.extend_base_index is not None else self.current_index
-                end_idx = self.extend_end_index
-                segs = "+".join(str(i + 1) for i in range(base_idx, end_idx + 1))
-                msg = f"Anki card created for segments {segs} in deck '{deck_name}'."
-            else:
-                msg = f"Anki card created for segment {self.current_index + 1} in deck '{deck_name}'."
-            self._message(QMessageBox.Icon.Information, "Card Created", msg)
+    def _on_card_done(self):
+        job, self._card_job = self._card_job, None
+        self.create_card_btn.setText("Create Anki Card")
+        self._known_decks.add(job["deck"])
+        self._submitted_notes.add(job["note_key"])
+
+        # Friendly message shows combined segment indices when extended
+        if job["label"]:
+            msg = f"Anki card created for segments {job['label']} in deck '{job['deck']}'."
+        else:
+            msg = f"Anki card created for segment {job['index'] + 1} in deck '{job['deck']}'."
+        self._message(QMessageBox.Icon.Information, "Card Created", msg, blocking=False)
+        if self.current_index == job["index"]:
+            # Exit extended mode first: its display refresh re-enables the button
+            self.cancel_extend_selection()
             self.card_created_for_current_segment = True
             self.set_create_button_enabled(False)
-            # Exit extended mode after successful creation
-            self.cancel_extend_selection()
+        else:
+            # The user moved on while the card was written
+            self.set_create_button_enabled(True)
 
-        except Exception as e:
-            self._message(
-                QMessageBox.Icon.Critical,
-                "Anki Error",
-                f"Failed to create Anki card: {e}. Ensure Anki and the Anki‑Connect add‑on are running.",
-            )
+    def _on_card_failed(self, error: Exception):
+        from anki_slicer.ankiconnect import AnkiConnectError
+
+        job, self._card_job = self._card_job, None
+        self.create_card_btn.setText("Create Anki Card")
+        self.set_create_button_enabled(True)
+        # Expected failures: Anki went away or the clip could not be written
+        if not isinstance(error, (AnkiConnectError, OSError)):
+            logger.error("Unexpected error while creating an Anki card", exc_info=error)
+        self._card_error(job["deck"], error)
+
+    def _card_error(self, deck_name: str, error: Exception):
+        # The deck may have been deleted in Anki; recreate it on the next attempt
+        self._known_decks.discard(deck_name)
+        self._message(
+            QMessageBox.Icon.Critical,
+            "Anki Error",
+            f"Failed to create Anki card: {error}. Ensure Anki and the Anki‑Connect add‑on are running.",
+        )
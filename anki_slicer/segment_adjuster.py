@@ -1,9 +1,8 @@
 from typing import Optional
 import numpy as np
-from pydub import AudioSegment
 from PyQt6.QtWidgets import QWidget, QSizePolicy
-from PyQt6.QtCore import Qt, QRectF, QPointF
-from PyQt6.QtGui import QPainter, QColor, QPen, QBrush, QPolygonF
+from PyQt6.QtCore import Qt, QRectF
+from PyQt6.QtGui import QPainter, QColor, QPen, QBrush, QPolygonF, QPixmap
 import logging
 
 logger = logging.getLogger(__name__)
@@ -22,13 +21,32 @@ class SegmentAdjusterWidget(QWidget):
         # Type annotations for static checkers
         self.waveform: Optional[np.ndarray] = None
         self.sample_rate: Optional[int] = None
+        # Waveform rendered for the current bounds/geometry; dragging the
+        # selection handles repaints by blitting it instead of redrawing
+        self._wave_pixmap: Optional[QPixmap] = None
+        self._wave_pixmap_key: Optional[tuple] = None
 
         if audio_path:
             self.load_waveform(audio_path)
 
     def load_waveform(self, audio_path: str):
         """Precompute normalized waveform samples for drawing"""
+        self.set_waveform(*self.read_waveform(audio_path))
+
+    def set_waveform(self, samples: Optional[np.ndarray], sample_rate: Optional[int]):
+        """Install samples produced by read_waveform (e.g. on a worker thread)."""
+        self.waveform = samples
+        self.sample_rate = sample_rate
+        self._wave_pixmap_key = None
+        self.update()
+
+    @staticmethod
+    def read_waveform(audio_path: str):
+        """Decode audio_path to normalized mono samples; returns (samples, rate)."""
         try:
+            # Imported here: pydub is slow to import and only this path needs it
+            from pydub import AudioSegment
+
             audio = AudioSegment.from_file(audio_path)
             samples = np.array(audio.get_array_of_samples()).astype(np.float32)
 
@@ -42,12 +60,10 @@ class SegmentAdjusterWidget(QWidget):
             if peak > 0:
                 samples /= peak
 
-            self.waveform = samples
-            self.sample_rate = int(audio.frame_rate)
+            return samples, int(audio.frame_rate)
         except Exception as e:
             logger.warning("Failed to load waveform: %s", e)
-            self.waveform = None
-            self.sample_rate = None
+            return None, None
 
     def set_bounds_and_selection(
         self, raw_start: float, raw_end: float, sel_start: float, sel_end: float
@@ -150,31 +166,48 @@ class SegmentAdjusterWidget(QWidget):
         if end_sample <= start_sample:
             return
 
-        chunk = wf[start_sample:end_sample]
-        if chunk.size == 0:
-            return
-
-        # Downsample to fit widget width
-        target_width = max(1, int(track_rect.width()))
+        dpr = self.devicePixelRatioF()
+        key = (start_sample, end_sample, track_rect.width(), track_rect.height(), dpr)
+        if key != self._wave_pixmap_key:
+            self._wave_pixmap = self._render_waveform(
+                wf[start_sample:end_sample], track_rect.width(), track_rect.height(), dpr
+            )
+            self._wave_pixmap_key = key
+        painter.drawPixmap(track_rect.topLeft(), self._wave_pixmap)
+
+    @staticmethod
+    def _render_waveform(chunk: np.ndarray, width: float, height: float, dpr: float) -> QPixmap:
+        pixmap = QPixmap(max(1, int(width * dpr)), max(1, int(height * dpr)))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        # Downsample to fit widget width: min and max of each pixel column,
+        # so short peaks are not skipped the way plain decimation skips them
+        target_width = max(1, int(width))
         if chunk.shape[0] > target_width:
-            step = max(1, chunk.shape[0] // target_width)
-            chunk = chunk[::step]
-
-        # Build waveform polyline
+            bucket = chunk.shape[0] // target_width
+            cols = chunk[: bucket * target_width].reshape(target_width, bucket)
+            values = np.empty(2 * target_width, dtype=np.float64)
+            values[0::2] = cols.min(axis=1)
+            values[1::2] = cols.max(axis=1)
+        else:
+            values = chunk.astype(np.float64)
+
+        # Build waveform polyline, writing the points straight into its buffer
+        scale = height / 2.2  # leave some margin
+        n = values.shape[0]
         poly = QPolygonF()
-        center_y = track_rect.center().y()
-        scale = track_rect.height() / 2.2  # leave some margin
-        n = chunk.shape[0]
-
-        for i in range(n):
-            x = (
-                track_rect.left() + (i / max(1, n - 1)) * track_rect.width()
-                if n > 1
-                else track_rect.left()
-            )
-            y = center_y - float(chunk[i]) * scale
-            poly.append(QPointF(x, y))
+        poly.resize(n)
+        buf = poly.data()
+        buf.setsize(n * 2 * np.dtype(np.float64).itemsize)
+        points = np.frombuffer(buf, dtype=np.float64).reshape(n, 2)
+        points[:, 0] = np.linspace(0.0, width, n)
+        points[:, 1] = height / 2 - values * scale
 
         # Draw waveform
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         painter.setPen(QPen(QColor("#2f5aa8"), 1))
         painter.drawPolyline(poly)
+        painter.end()
+        return pixmap
@@ -1,5 +1,6 @@
 # Updated slice_audio function for slicer.py
 # Add override_start and override_end parameters
+from typing import Optional
 
 
 def slice_audio(
@@ -18,21 +19,12 @@ def slice_audio(
     Returns:
         str: Path to the created audio clip
     """
-    from pydub import AudioSegment
     import os
 
     # Use override times if provided, otherwise use subtitle entry times
     start_time = override_start if override_start is not None else entry.start_time
     end_time = override_end if override_end is not None else entry.end_time
 
-    # Convert to milliseconds for pydub
-    start_ms = int(start_time * 1000)
-    end_ms = int(end_time * 1000)
-
-    # Load and slice the audio
-    audio = AudioSegment.from_file(mp3_path)
-    clip = audio[start_ms:end_ms]
-
     # Create output directory if it doesn't exist
     os.makedirs(out_dir, exist_ok=True)
 
@@ -43,7 +35,56 @@ def slice_audio(
     filename = f"{entry.index:03d}_{safe_text}.mp3"
     output_path = os.path.join(out_dir, filename)
 
-    # Export the clip
-    clip.export(output_path, format="mp3")
+    # Export the clip: ffmpeg seeks and decodes only the slice; pydub
+    # (full decode of the source) is the fallback
+    if not ffmpeg_slice(mp3_path, start_time, end_time, output_path):
+        from pydub import AudioSegment
+
+        audio = AudioSegment.from_file(mp3_path)
+        clip = audio[int(start_time * 1000) : int(end_time * 1000)]
+        clip.export(output_path, format="mp3")
 
     return output_path
+
+
+def ffmpeg_slice(src: str, start: float, end: float, output_path: str) -> bool:
+    """Encode src[start:end] to MP3 with ffmpeg. Return False if that failed."""
+    if end <= start:
+        return False
+    return _run_ffmpeg(
+        "-ss", f"{start:.3f}", "-t", f"{end - start:.3f}", "-i", src,
+        "-vn", "-c:a", "libmp3lame", "-f", "mp3", output_path,
+    )
+
+
+def ffmpeg_to_wav(src: str, output_path: str, rate: int = 44100, channels: int = 2) -> bool:
+    """Transcode src to 16-bit PCM WAV with ffmpeg. Return False if that failed."""
+    return _run_ffmpeg(
+        "-i", src, "-vn", "-map_metadata", "-1",
+        "-ar", str(rate), "-ac", str(channels), "-c:a", "pcm_s16le",
+        "-f", "wav", output_path,
+    )
+
+
+def ffmpeg_encode_pcm(pcm: bytes, rate: int, channels: int, output_path: str) -> bool:
+    """Encode raw 16-bit little-endian PCM to MP3 with ffmpeg (fed on stdin)."""
+    return _run_ffmpeg(
+        "-f", "s16le", "-ar", str(rate), "-ac", str(channels), "-i", "pipe:0",
+        "-c:a", "libmp3lame", "-f", "mp3", output_path,
+        stdin=pcm,
+    )
+
+
+def _run_ffmpeg(*args: str, stdin: Optional[bytes] = None) -> bool:
+    import shutil
+    import subprocess
+
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        return False
+    cmd = [ffmpeg, "-hide_banner", "-loglevel", "error", "-y", *args]
+    try:
+        subprocess.run(cmd, input=stdin, check=True, capture_output=True)
+    except (OSError, subprocess.CalledProcessError):
+        return False
+    return True
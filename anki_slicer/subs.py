@@ -1,14 +1,37 @@
 import re
 import logging
 import os
-from typing import List, Tuple, Optional
+import threading
+from collections import OrderedDict
+from typing import Iterator, List, Tuple, Optional
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+# Leading number of an index line (a BOM or stray prefix is skipped)
+_IDX_RE = re.compile(r"\D*(\d+)")
+# HH:MM:SS,mmm (or with a period)
+_TS_RE = re.compile(r"(\d{1,2}):(\d{2}):(\d{2})[\.,](\d{3})")
+# A whole "HH:MM:SS,mmm --> HH:MM:SS,mmm" line; used to find cue timings in
+# .txt translations
+TIMESTAMP_LINE_RE = re.compile(
+    r"^\s*\d{2}:\d{2}:\d{2},\d{3}\s*-->\s*\d{2}:\d{2}:\d{2},\d{3}\s*$"
+)
+
+# Parsed files as (index, start, end, text) rows, keyed by (path, mtime, size)
+# so reopening an unchanged file skips the parse; least recently used first
+_PARSE_CACHE: "OrderedDict[tuple, List[tuple]]" = OrderedDict()
+_PARSE_CACHE_SIZE = 16
+# Files are also parsed on worker threads (the file selector prewarms them)
+_PARSE_CACHE_LOCK = threading.Lock()
+
 
 @dataclass
 class SubtitleEntry:
+    # Slots instead of a per-instance __dict__: a file can hold thousands of
+    # entries. (dataclass(slots=True) needs Python 3.10.)
+    __slots__ = ("index", "start_time", "end_time", "text")
+
     index: int
     start_time: float  # seconds
     end_time: float  # seconds
@@ -20,87 +43,169 @@ class SRTParser:
     def parse_srt_file(filepath: str) -> List[SubtitleEntry]:
         """Parse an SRT file and return list of SubtitleEntry objects.
         More robust handling of CRLF, BOM, and leading blank lines.
+
+        Results are cached per file version; every call returns fresh
+        entries, so edits to one list never show up in another.
+        """
+        st = os.stat(filepath)
+        key = (os.path.abspath(filepath), st.st_mtime_ns, st.st_size)
+        with _PARSE_CACHE_LOCK:
+            rows = _PARSE_CACHE.get(key)
+            if rows is not None:
+                _PARSE_CACHE.move_to_end(key)
+        if rows is not None:
+            return [SubtitleEntry(*row) for row in rows]
+
+        # Parsed outside the lock; if two threads miss at once both parse and
+        # the later insert wins, which is harmless
+        entries = list(SRTParser.iter_srt_file(filepath))
+        rows = [(e.index, e.start_time, e.end_time, e.text) for e in entries]
+        with _PARSE_CACHE_LOCK:
+            _PARSE_CACHE[key] = rows
+            _PARSE_CACHE.move_to_end(key)
+            if len(_PARSE_CACHE) > _PARSE_CACHE_SIZE:
+                _PARSE_CACHE.popitem(last=False)
+        return entries
+
+    @staticmethod
+    def iter_srt_file(filepath: str) -> Iterator[SubtitleEntry]:
+        """Yield the entries of an SRT file in order, each as its block is parsed.
+
+        Unlike parse_srt_file this always reads the file and is not cached.
         """
+        # Read once as bytes: text mode would rescan for newlines while
+        # decoding, and a decode error meant reading the file again
+        with open(filepath, "rb") as f:
+            raw = f.read()
+
+        # Normalize newlines before decoding (\r and \n are single bytes in
+        # both encodings tried below); LF-only files skip this entirely
+        if b"\r" in raw:
+            raw = raw.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
         try:
-            with open(filepath, "r", encoding="utf-8", errors="strict") as f:
-                content = f.read()
+            content = raw.decode("utf-8")
         except UnicodeDecodeError:
-            with open(filepath, "r", encoding="latin-1", errors="ignore") as f:
-                content = f.read()
+            content = raw.decode("latin-1", errors="ignore")
 
-        # Normalize newlines and strip BOM
-        content = content.replace("\r\n", "\n").replace("\r", "\n")
+        # Strip BOM
         content = content.lstrip("\ufeff")
         # Keep trailing newline structure; don't strip() entire file which can drop first/last lines
 
-        entries: List[SubtitleEntry] = []
+        parsed = 0
+        # Checked once per file so disabled debug logging costs nothing per block
+        debug = logger.isEnabledFor(logging.DEBUG)
+        debug_dump = debug and bool(os.getenv("ANKI_SLICER_DEBUG"))
+        # BOMs left after the one at the head (e.g. concatenated files) are
+        # stripped per line; most files have none and skip that copy
+        strip_bom = "\ufeff" in content
 
-        # Split on blank line(s) followed by an index line
-        blocks = re.split(r"\n{2,}(?=\d+\s*\n)", content)
+        # One pass over the lines: a new block starts at an index-only line
+        # (digits, optional trailing spaces) that follows an empty line
+        lines = content.split("\n")
+        last = len(lines) - 1
+        block: List[str] = []
+        blocks = 0
+        prev_empty = False
+        for n, line in enumerate(lines):
+            if (
+                prev_empty
+                and n < last
+                and line[:1].isdecimal()
+                and line.rstrip().isdecimal()
+            ):
+                entry = SRTParser._parse_block(
+                    block, parsed, filepath, debug, debug_dump, strip_bom
+                )
+                if entry is not None:
+                    parsed += 1
+                    yield entry
+                blocks += 1
+                block = []
+            block.append(line)
+            prev_empty = not line
+        entry = SRTParser._parse_block(block, parsed, filepath, debug, debug_dump, strip_bom)
+        if entry is not None:
+            yield entry
 
-        logger.debug("SRT blocks loaded (%d blocks) from %s", len(blocks), filepath)
+        if debug:
+            logger.debug("SRT blocks loaded (%d blocks) from %s", blocks + 1, filepath)
 
-        debug_dump = bool(os.getenv("ANKI_SLICER_DEBUG"))
-        for raw_block in blocks:
-            block = raw_block.strip("\n")
-            if not block.strip():
-                continue
+    @staticmethod
+    def _parse_block(
+        block: List[str],
+        parsed: int,
+        filepath: str,
+        debug: bool,
+        debug_dump: bool,
+        strip_bom: bool,
+    ) -> Optional[SubtitleEntry]:
+        """Parse one block's lines; None if it holds no valid entry.
 
-            lines = [ln.strip("\ufeff") for ln in block.split("\n")]
-            # Skip leading empties
-            i = 0
-            while i < len(lines) and not lines[i].strip():
-                i += 1
-            if i >= len(lines):
-                continue
-
-            # Index line may contain BOM or spaces
-            idx_line = lines[i].strip()
-            # Some generators omit the numeric index; detect and synthesize
-            try:
-                index = int(re.match(r"\D*(\d+)", idx_line).group(1))
-                i += 1
-            except Exception:
-                # If the first non-empty line is actually the timestamp, synthesize index
-                index = len(entries) + 1
+        parsed is the number of entries before this block (for a missing index).
+        """
+        # Empty lines between blocks are separators, not text
+        end = len(block)
+        while end and not block[end - 1]:
+            end -= 1
+        if not any(ln.strip() for ln in block[:end]):
+            return None
 
-            if i >= len(lines):
-                continue
+        lines = block[:end]
+        if strip_bom:
+            lines = [ln.strip("\ufeff") for ln in lines]
+        # Skip leading empties
+        i = 0
+        while i < len(lines) and not lines[i].strip():
+            i += 1
+        if i >= len(lines):
+            return None
+
+        # Index line may contain BOM or spaces
+        idx_line = lines[i].strip()
+        # Some generators omit the numeric index; detect and synthesize
+        try:
+            index = int(_IDX_RE.match(idx_line).group(1))
+            i += 1
+        except Exception:
+            # If the first non-empty line is actually the timestamp, synthesize index
+            index = parsed + 1
 
-            # Timestamp line
+        if i >= len(lines):
+            return None
+
+        # Timestamp line
+        time_line = lines[i].strip()
+        if "-->" not in time_line:
+            # Try next line if index line consumed but timestamp is on following line
+            i += 1
+            if i >= len(lines):
+                return None
             time_line = lines[i].strip()
-            if "-->" not in time_line:
-                # Try next line if index line consumed but timestamp is on following line
-                i += 1
-                if i >= len(lines):
-                    continue
-                time_line = lines[i].strip()
-            try:
-                start_str, end_str = [s.strip() for s in time_line.split("-->")]
-                start_time = SRTParser._parse_timestamp(start_str)
-                end_time = SRTParser._parse_timestamp(end_str)
-            except Exception as e:
-                logger.warning("Skipping block with bad timestamp: %r (%s)", time_line, e)
-                continue
-
-            # Remaining lines are text (preserve internal newlines)
-            text_lines = lines[i + 1 :]
-            text = "\n".join(text_lines).strip()
-
-            if debug_dump and len(entries) < 2:
-                # Dump a detailed view of the first two blocks to help diagnose parsing
-                logger.debug(
-                    "[DEBUG SRT] file=%s idx=%s raw_block=%r lines=%r text=%r",
-                    filepath,
-                    index,
-                    raw_block[:200],
-                    lines,
-                    text,
-                )
-            logger.debug("SubtitleEntry index=%s text_len=%d", index, len(text))
-            entries.append(SubtitleEntry(index, start_time, end_time, text))
+        try:
+            start_str, end_str = [s.strip() for s in time_line.split("-->")]
+            start_time = SRTParser._parse_timestamp(start_str)
+            end_time = SRTParser._parse_timestamp(end_str)
+        except Exception as e:
+            logger.warning("Skipping block with bad timestamp: %r (%s)", time_line, e)
+            return None
 
-        return entries
+        # Remaining lines are text (preserve internal newlines)
+        text_lines = lines[i + 1 :]
+        text = "\n".join(text_lines).strip()
+
+        if debug_dump and parsed < 2:
+            # Dump a detailed view of the first two blocks to help diagnose parsing
+            logger.debug(
+                "[DEBUG SRT] file=%s idx=%s raw_block=%r lines=%r text=%r",
+                filepath,
+                index,
+                "\n".join(block)[:200],
+                lines,
+                text,
+            )
+        if debug:
+            logger.debug("SubtitleEntry index=%s text_len=%d", index, len(text))
+        return SubtitleEntry(index, start_time, end_time, text)
 
     @staticmethod
     def _parse_timestamp(timestamp_str: str) -> float:
@@ -112,7 +217,7 @@ class SRTParser:
         timestamp_str = timestamp_str.replace(",", ".")
 
         # Parse HH:MM:SS.mmm
-        match = re.match(r"(\d{1,2}):(\d{2}):(\d{2})[\.,](\d{3})", timestamp_str)
+        match = _TS_RE.match(timestamp_str)
         if not match:
             raise ValueError(f"Invalid timestamp format: {timestamp_str}")
 
@@ -6,38 +6,61 @@ from PyQt6.QtWidgets import (
     QFileDialog,
     QMessageBox,
 )
-from PyQt6.QtCore import QSettings, pyqtSignal
+from PyQt6.QtCore import QSettings, QThreadPool, QTimer, pyqtSignal
 from PyQt6.QtGui import QIcon, QPixmap
 from pathlib import Path
-from .player import PlayerUI
-from .subs import SRTParser, SubtitleEntry
+from .subs import SRTParser, SubtitleEntry, TIMESTAMP_LINE_RE
+import functools
 import os
-import re
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Resolved once at import rather than for every window and dialog
+_APP_ICON_PATH = Path(__file__).resolve().parent.parent / "images" / "app_icon.png"
+
+
+def _prewarm_srt(path: str):
+    """Parse an SRT into SRTParser's cache so Start finds it ready.
+
+    Runs on a pool thread; the cache is lock-protected, so start_player can
+    look the file up concurrently. Errors are left for start_player, which
+    reports them to the user.
+    """
+    try:
+        SRTParser.parse_srt_file(path)
+    except Exception:
+        logger.debug("Background parse of %s failed", path, exc_info=True)
 
-TIMESTAMP_RE = re.compile(
-    r"^\s*\d{2}:\d{2}:\d{2},\d{3}\s*-->\s*\d{2}:\d{2}:\d{2},\d{3}\s*$"
-)
+
+def _import_player():
+    """Import the player module (QtMultimedia, numpy, pydub glue) ahead of Start."""
+    from . import player  # noqa: F401
 
 
 class FileSelectorUI(QWidget):
     # Emitted when a new Player window is launched
     playerLaunched = pyqtSignal()
+    # The platform's native picker by default (fastest on big folders);
+    # ANKI_SLICER_QT_DIALOG=1 switches to Qt's own dialog. Either way skip
+    # the per-folder icon lookups and symlink resolution that make Qt's
+    # dialog crawl on large or network directories
+    _DIALOG_OPTIONS = (
+        QFileDialog.Option.DontResolveSymlinks
+        | QFileDialog.Option.DontUseCustomDirectoryIcons
+        | QFileDialog.Option.ReadOnly
+    )
+    if os.getenv("ANKI_SLICER_QT_DIALOG"):
+        _DIALOG_OPTIONS |= QFileDialog.Option.DontUseNativeDialog
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Anki‑Slicer – Select Files")
         self.setMinimumSize(400, 200)
 
         # Set window icon if present
-        try:
-            icon_path = Path(__file__).resolve().parent.parent / "images" / "app_icon.png"
-            if icon_path.exists():
-                self.setWindowIcon(QIcon(str(icon_path)))
-        except Exception:
-            pass
+        if _APP_ICON_PATH.exists():
+            self.setWindowIcon(QIcon(str(_APP_ICON_PATH)))
 
         self.audio_path = None
         self.orig_srt = None
@@ -74,6 +97,10 @@ class FileSelectorUI(QWidget):
         self.start_btn.clicked.connect(self.start_player)
 
         self.player = None
+        self._icon_pixmap = None
+        # The selector paints first; the player's heavy imports load once the
+        # event loop is idle instead of delaying startup
+        QTimer.singleShot(100, _import_player)
 
         # In debug runs, prefill last-used files to speed iteration
         try:
@@ -121,7 +148,7 @@ class FileSelectorUI(QWidget):
             "Select Audio File",
             last_dir,
             "Audio Files (*.mp3 *.wav *.m4a *.flac *.ogg *.aac);;All Files (*)",
-            options=QFileDialog.Option.DontUseNativeDialog,
+            options=self._DIALOG_OPTIONS,
         )
         if path:
             self.audio_path = path
@@ -136,13 +163,16 @@ class FileSelectorUI(QWidget):
             "Select Original Subtitles",
             last_dir,
             "Subtitle Files (*.srt);;All Files (*)",
-            options=QFileDialog.Option.DontUseNativeDialog,
+            options=self._DIALOG_OPTIONS,
         )
         if path:
             self.orig_srt = path
             self.orig_label.setText(path)
             self._set_last_dir(path)
             self.settings.setValue("last_orig_srt", path)
+            # Parse while the user picks the other files
+            if self._ext(path) == "srt":
+                QThreadPool.globalInstance().start(functools.partial(_prewarm_srt, path))
 
     def select_trans(self):
         last_dir = self._get_last_dir()
@@ -151,26 +181,32 @@ class FileSelectorUI(QWidget):
             "Select Translation Subtitles",
             last_dir,
             "Subtitle/Text Files (*.srt *.txt);;All Files (*)",
-            options=QFileDialog.Option.DontUseNativeDialog,
+            options=self._DIALOG_OPTIONS,
         )
         if path:
             self.trans_srt = path
             self.trans_label.setText(path)
             self._set_last_dir(path)
             self.settings.setValue("last_trans_srt", path)
+            if self._ext(path) == "srt":
+                QThreadPool.globalInstance().start(functools.partial(_prewarm_srt, path))
 
     # ---------- Subtitle Loading ----------
 
     @staticmethod
     def _ext(path: str) -> str:
-        return os.path.splitext(path)[1].lower().lstrip(".")
+        # Dots in directory names or leading a file name (".srt") are not
+        # extensions, same as os.path.splitext
+        stem, dot, ext = os.path.basename(path).rpartition(".")
+        return ext.lower() if stem.strip(".") else ""
 
     @staticmethod
     def _read_text_lines(path: str) -> list[str]:
         with open(path, "r", encoding="utf-8", errors="ignore") as f:
             content = f.read()
         # Do NOT drop blank lines here; we preserve them so we can parse properly.
-        return [line.rstrip("\n") for line in content.splitlines()]
+        # splitlines() already removes the line endings.
+        return content.splitlines()
 
     def _parse_txt_blocks(self, path: str) -> list[str]:
         """
@@ -185,8 +221,12 @@ class FileSelectorUI(QWidget):
         """
         lines = self._read_text_lines(path)
 
-        # Find indices of all timestamp lines
-        ts_indices = [i for i, ln in enumerate(lines) if TIMESTAMP_RE.match(ln)]
+        # Find indices of all timestamp lines. The substring test is a cheap
+        # prefilter: text lines never reach the regex
+        ts_match = TIMESTAMP_LINE_RE.match
+        ts_indices = [
+            i for i, ln in enumerate(lines) if "-->" in ln and ts_match(ln)
+        ]
 
         blocks: list[str] = []
 
@@ -204,32 +244,29 @@ class FileSelectorUI(QWidget):
                 if i < end_ts_line and lines[i].strip().isdigit():
                     i += 1
 
-                content_lines = lines[i:end_ts_line]
-
                 # Drop leading/trailing blank lines within the segment
                 # but keep internal blank lines (for Markdown readability).
-                # Trim leading blanks
-                while content_lines and not content_lines[0].strip():
-                    content_lines.pop(0)
-                # Trim trailing blanks
-                while content_lines and not content_lines[-1].strip():
-                    content_lines.pop()
+                # Both ends are found by index so only one slice is made.
+                end = end_ts_line
+                while i < end and not lines[i].strip():
+                    i += 1
+                while end > i and not lines[end - 1].strip():
+                    end -= 1
 
-                blocks.append("\n".join(content_lines).strip())
+                blocks.append("\n".join(lines[i:end]).strip())
 
         else:
             # Non-timestamped .txt mode: split by blank lines
             buf = []
             for line in lines:
-                if not line.strip():  # blank line => end of block
+                stripped = line.strip()
+                if not stripped:  # blank line => end of block
                     if buf:
                         blocks.append("\n".join(buf).strip())
                         buf = []
                     continue
                 # ignore pure index and timestamp-looking lines just in case
-                if line.strip().isdigit():
-                    continue
-                if "-->" in line:
+                if stripped.isdigit() or "-->" in line:
                     continue
                 buf.append(line)
             if buf:
@@ -250,110 +287,76 @@ class FileSelectorUI(QWidget):
         if ext == "txt":
             blocks = self._parse_txt_blocks(path)
 
-            # Map blocks to original timings in order
-            n = min(len(blocks), len(orig_entries))
-            entries = []
-            for i in range(n):
-                o = orig_entries[i]
-                entries.append(
-                    SubtitleEntry(
-                        index=i + 1,
-                        start_time=o.start_time,
-                        end_time=o.end_time,
-                        text=blocks[i],
-                    )
-                )
-            return entries
+            # Map blocks to original timings in order (zip stops at the shorter list)
+            return [
+                SubtitleEntry(i, o.start_time, o.end_time, text)
+                for i, (o, text) in enumerate(zip(orig_entries, blocks), start=1)
+            ]
 
         raise ValueError(f"Unsupported translation format: .{ext}")
 
+    # ---------- Message helpers ----------
+
+    def _app_icon_pixmap(self) -> QPixmap:
+        # Decoded and scaled on first use; null if the icon file is missing
+        if self._icon_pixmap is None:
+            pm = QPixmap(str(_APP_ICON_PATH)) if _APP_ICON_PATH.exists() else QPixmap()
+            self._icon_pixmap = pm.scaled(64, 64) if not pm.isNull() else pm
+        return self._icon_pixmap
+
+    def _message(self, icon: QMessageBox.Icon, title: str, text: str):
+        box = QMessageBox(self)
+        # Same titlebar icon as this window (set in __init__)
+        box.setWindowIcon(self.windowIcon())
+        box.setIcon(icon)
+        # Set in-dialog pixmap AFTER setIcon so it takes effect
+        pm = self._app_icon_pixmap()
+        if not pm.isNull():
+            box.setIconPixmap(pm)
+        box.setWindowTitle(title)
+        box.setText(text)
+        box.exec()
+
     # ---------- Start Player ----------
 
     def start_player(self):
         if not (self.audio_path and self.orig_srt and self.trans_srt):
-            box = QMessageBox(self)
-            try:
-                icon_path = Path(__file__).resolve().parent.parent / "images" / "app_icon.png"
-                if icon_path.exists():
-                    box.setWindowIcon(QIcon(str(icon_path)))
-            except Exception:
-                pass
-            box.setIcon(QMessageBox.Icon.Warning)
-            try:
-                # Set in-dialog pixmap AFTER setIcon so it takes effect
-                pm = QPixmap(str(icon_path))
-                if not pm.isNull():
-                    box.setIconPixmap(pm.scaled(64, 64))
-            except Exception:
-                pass
-            box.setWindowTitle("Missing Files")
-            box.setText("Please select audio, original SRT, and translation file.")
-            box.exec()
+            self._message(
+                QMessageBox.Icon.Warning,
+                "Missing Files",
+                "Please select audio, original SRT, and translation file.",
+            )
             return
 
         try:
             orig_entries = self._load_original_entries(self.orig_srt)
         except Exception as e:
-            box = QMessageBox(self)
-            try:
-                icon_path = Path(__file__).resolve().parent.parent / "images" / "app_icon.png"
-                if icon_path.exists():
-                    box.setWindowIcon(QIcon(str(icon_path)))
-            except Exception:
-                pass
-            box.setIcon(QMessageBox.Icon.Critical)
-            try:
-                pm = QPixmap(str(icon_path))
-                if not pm.isNull():
-                    box.setIconPixmap(pm.scaled(64, 64))
-            except Exception:
-                pass
-            box.setWindowTitle("Subtitle Error")
-            box.setText(f"Failed to load original subtitles:\n{e}")
-            box.exec()
+            self._message(
+                QMessageBox.Icon.Critical,
+                "Subtitle Error",
+                f"Failed to load original subtitles:\n{e}",
+            )
             return
 
         try:
             trans_entries = self._load_translation_entries(self.trans_srt, orig_entries)
         except Exception as e:
-            box = QMessageBox(self)
-            try:
-                icon_path = Path(__file__).resolve().parent.parent / "images" / "app_icon.png"
-                if icon_path.exists():
-                    box.setWindowIcon(QIcon(str(icon_path)))
-            except Exception:
-                pass
-            box.setIcon(QMessageBox.Icon.Critical)
-            try:
-                pm = QPixmap(str(icon_path))
-                if not pm.isNull():
-                    box.setIconPixmap(pm.scaled(64, 64))
-            except Exception:
-                pass
-            box.setWindowTitle("Subtitle Error")
-            box.setText(f"Failed to load translation subtitles:\n{e}")
-            box.exec()
+            self._message(
+                QMessageBox.Icon.Critical,
+                "Subtitle Error",
+                f"Failed to load translation subtitles:\n{e}",
+            )
             return
 
         # Helpful info if counts mismatch
         if len(trans_entries) != len(orig_entries):
-            box = QMessageBox(self)
-            try:
-                icon_path = Path(__file__).resolve().parent.parent / "images" / "app_icon.png"
-                if icon_path.exists():
-                    box.setWindowIcon(QIcon(str(icon_path)))
-            except Exception:
-                pass
-            box.setIcon(QMessageBox.Icon.Information)
-            try:
-                pm = QPixmap(str(icon_path))
-                if not pm.isNull():
-                    box.setIconPixmap(pm.scaled(64, 64))
-            except Exception:
-                pass
-            box.setWindowTitle("Note")
-            box.setText(f"Translation entries: {len(trans_entries)} vs Original entries: {len(orig_entries)}.\nThey have been truncated to the shorter length.")
-            box.exec()
+            self._message(
+                QMessageBox.Icon.Information,
+                "Note",
+                f"Translation entries: {len(trans_entries)} vs Original entries: {len(orig_entries)}.\nThey have been truncated to the shorter length.",
+            )
+
+        from .player import PlayerUI
 
         self.player = PlayerUI(self.audio_path, orig_entries, trans_entries)
         self.player.show()
@@ -3,17 +3,23 @@ import re
 with open("EN_DouWenTao1_markdown.srt", "r", encoding="utf-8") as f:
     content = f.read()
 
-# Pattern: double newline followed by index number at start of line
-block_start_re = re.compile(r"\n\n(?=\d+\n)")
+# A run of blank lines, noting whether an index line ("12\n") follows it
+blank_run_re = re.compile(r"(\n{2,})((?=\d+\n))?")
 
-# Split into blocks
-blocks = block_start_re.split(content)
 
-# Remove all other double newlines within blocks
-cleaned_blocks = [re.sub(r"\n\n(?!\d+\n)", "\n", block) for block in blocks]
+def _collapse(m):
+    # Halve each run of newlines, so blank lines inside a block go away.
+    # The last two newlines before an index line stay as the separator
+    # between blocks.
+    n = len(m.group(1))
+    if m.group(2) is None:
+        return "\n" * ((n + 1) // 2)
+    return "\n" * ((n - 1) // 2) + "\n\n"
 
-# Rejoin blocks with double newline before index
-result = "\n\n".join(cleaned_blocks)
+
+# One pass over the file instead of splitting into blocks and
+# substituting in each
+result = blank_run_re.sub(_collapse, content)
 
 with open("EN_DouWenTao1_markdown.srt", "w", encoding="utf-8") as f:
     f.write(result)
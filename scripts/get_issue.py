@@ -1,25 +1,32 @@
-import json
 import os
 import sys
 import ssl
-import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from github_cache import fetch_json
 
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: get_issue.py <number> [<owner/repo>]")
+    args = sys.argv[1:]
+    # An optional trailing owner/repo; everything before it is issue numbers
+    repo = args.pop() if args and "/" in args[-1] else os.environ.get("REPO", "LeeHunter/anki-slicer")
+    if not args:
+        print("Usage: get_issue.py <number> [<number> ...] [<owner/repo>]")
         sys.exit(1)
-    num = sys.argv[1]
-    repo = sys.argv[2] if len(sys.argv) > 2 else os.environ.get("REPO", "LeeHunter/anki-slicer")
-    url = f"https://api.github.com/repos/{repo}/issues/{num}"
     ctx = ssl._create_unverified_context() if os.environ.get("INSECURE") else None
-    with urllib.request.urlopen(url, context=ctx) as r:
-        data = json.load(r)
-    print(f"#{data.get('number')} {data.get('title')}")
-    print()
-    print(data.get('body') or "(no description)")
+    # Each issue is fetched and printed once, even if repeated
+    nums = list(dict.fromkeys(args))
+    urls = [f"https://api.github.com/repos/{repo}/issues/{num}" for num in nums]
+    # Fetch concurrently (sockets release the GIL); print in argument order
+    with ThreadPoolExecutor(max_workers=min(8, len(urls))) as pool:
+        issues = list(pool.map(lambda url: fetch_json(url, ctx), urls))
+    for n, data in enumerate(issues):
+        if n:
+            print("\n" + "-" * 40 + "\n")
+        print(f"#{data.get('number')} {data.get('title')}")
+        print()
+        print(data.get('body') or "(no description)")
 
 
 if __name__ == "__main__":
     main()
-
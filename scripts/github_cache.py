@@ -0,0 +1,55 @@
+import hashlib
+import json
+import os
+import tempfile
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+CACHE_DIR = Path.home() / ".cache" / "anki-slicer"
+
+
+def fetch_json(url, ctx=None):
+    """GET a GitHub API URL, reusing the cached body when GitHub replies 304.
+
+    The last ETag and body for each URL live under CACHE_DIR; unchanged
+    data then costs a bodyless round-trip and no rate-limit hit.
+    """
+    key = hashlib.sha1(url.encode()).hexdigest()
+    etag_path = CACHE_DIR / f"{key}.etag"
+    body_path = CACHE_DIR / f"{key}.json"
+
+    headers = {}
+    if etag_path.exists() and body_path.exists():
+        headers["If-None-Match"] = etag_path.read_text(encoding="utf-8").strip()
+    req = urllib.request.Request(url, headers=headers)
+    try:
+        with urllib.request.urlopen(req, context=ctx) as r:
+            body = r.read()
+            etag = r.headers.get("ETag")
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return json.loads(body_path.read_bytes())
+        raise
+
+    if etag:
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            # Body first, then ETag, so a partial update never pairs a new
+            # ETag with an old body
+            _write_atomic(body_path, body)
+            _write_atomic(etag_path, etag.encode("utf-8"))
+        except OSError:
+            pass  # caching is best-effort
+    return json.loads(body)
+
+
+def _write_atomic(path, data):
+    # A unique temp file per write (threads share a pid), then rename
+    with tempfile.NamedTemporaryFile(dir=CACHE_DIR, delete=False) as f:
+        f.write(data)
+    try:
+        os.replace(f.name, path)
+    except OSError:
+        os.unlink(f.name)
+        raise
@@ -1,9 +1,9 @@
-import json
 import os
 import sys
-import urllib.request
 import ssl
 
+from github_cache import fetch_json
+
 
 def main():
     repo = os.environ.get("REPO", "LeeHunter/anki-slicer")
@@ -12,8 +12,7 @@ def main():
     if os.environ.get("INSECURE"):
         ctx = ssl._create_unverified_context()
     try:
-        with urllib.request.urlopen(url, context=ctx) as r:
-            data = json.load(r)
+        data = fetch_json(url, ctx)
     except Exception as e:
         print(f"ERROR: failed to fetch issues: {e}")
         sys.exit(2)